@@ -5,11 +5,21 @@ Fase 1: Setup + Upload básico
 
 import streamlit as st
 import pandas as pd
-from utils import FileHandler, get_dataframe_info
+from utils import FileHandler, get_dataframe_info, get_backend, NullityMask
+from utils.drift import ProfileStore, compare_profiles
+from utils.incremental import ProfileCache, ProfileState
+from utils.outliers import OutlierStats, detect_outliers, outlier_summary
+from utils.report import FragmentCache, build_sections, export_html
+from utils.scheduler import AnalysisScheduler, AnalysisTask, estimate_cost
 from utils.config import (
+    ANALYSIS_SAMPLE_ROWS,
+    ANALYSIS_TIME_BUDGET_S,
     MAX_FILE_SIZE_MB,
     SUPPORTED_EXTENSIONS,
     PREVIEW_ROWS,
+    REPORT_MAX_WORKERS,
+    DATAFRAME_BACKEND,
+    SERVER_DATA_ROOTS,
     MSG_FILE_TOO_LARGE,
     MSG_UPLOAD_SUCCESS
 )
@@ -37,6 +47,140 @@ def init_session_state():
         st.session_state.metadata = None
     if 'file_loaded' not in st.session_state:
         st.session_state.file_loaded = False
+    if 'profile' not in st.session_state:
+        st.session_state.profile = None
+    if 'nullity' not in st.session_state:
+        st.session_state.nullity = None
+    if 'outliers' not in st.session_state:
+        st.session_state.outliers = None
+    if 'reference' not in st.session_state:
+        st.session_state.reference = None
+    if 'analysis' not in st.session_state:
+        st.session_state.analysis = new_analysis()
+
+
+def new_analysis() -> dict:
+    """Estado del planificador para un dataset nuevo"""
+    return {
+        'spent': 0.0,       # segundos del presupuesto ya consumidos
+        'modes': {},        # tarea -> 'full' o 'sampled'
+        'timings': {},      # tarea -> modo, segundos y estimado
+        'exact': set(),     # tareas que el usuario pidió calcular completas
+        'sample': None,     # muestra de filas compartida por las aproximadas
+        'sampled': {}       # tarea -> resultado sobre la muestra
+    }
+
+
+def get_profile() -> dict:
+    """Calcula (una sola vez por dataset) el profiling con el backend activo"""
+    if st.session_state.profile is None:
+        df = st.session_state.df
+        metadata = st.session_state.metadata
+        state = metadata.get('profile_state')
+        
+        # Con carga incremental se construye el estado mergeable (la carga
+        # no lo calcula) para que el próximo append solo perfile la cola;
+        # si ya existe, get_profile_state lo guarda para comparaciones
+        if state is not None or metadata.get('cache_key') is not None:
+            state = get_profile_state(df, metadata)
+        
+        if state is not None:
+            # Profiling mergeable (combinado con la cola si fue incremental)
+            profile = state.summary()
+            if isinstance(df, pd.DataFrame):
+                profile['memory_usage_mb'] = round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2)
+        else:
+            profile = get_dataframe_info(df, backend=metadata.get('backend'))
+        
+        st.session_state.profile = profile
+    return st.session_state.profile
+
+
+def get_sample() -> pd.DataFrame:
+    """Muestra de filas (una por dataset) para las variantes aproximadas"""
+    analysis = st.session_state.analysis
+    if analysis['sample'] is None:
+        backend = get_backend(st.session_state.metadata.get('backend'))
+        analysis['sample'] = backend.sample(st.session_state.df, ANALYSIS_SAMPLE_ROWS)
+    return analysis['sample']
+
+
+def with_derivations(nullity: NullityMask) -> NullityMask:
+    """
+    Calcula dentro de la tarea los resultados que muestra la sección de nulos
+
+    Quedan memoizados en la máscara, así que el planificador mide su costo
+    y la sección solo los lee.
+    """
+    nullity.row_completeness()
+    nullity.patterns()
+    nullity.co_occurrence()
+    return nullity
+
+
+# Variantes aproximadas: el mismo análisis sobre la muestra (pandas)
+SAMPLED_ANALYSES = {
+    'profile': lambda sample: get_dataframe_info(sample, backend='pandas'),
+    'nullity': lambda sample: with_derivations(NullityMask.from_frame(sample, backend='pandas')),
+    'outliers': lambda sample: detect_outliers(
+        sample, OutlierStats.from_frame(sample, backend='pandas'), backend='pandas'
+    )
+}
+
+
+def get_sampled(name: str):
+    """Calcula (una sola vez por dataset) la variante aproximada de una tarea"""
+    analysis = st.session_state.analysis
+    if name not in analysis['sampled']:
+        analysis['sampled'][name] = SAMPLED_ANALYSES[name](get_sample())
+    return analysis['sampled'][name]
+
+
+def get_profile_state(df, metadata) -> ProfileState:
+    """
+    Estado de profiling mergeable de un dataset, guardado para comparaciones
+
+    Reutiliza el de la carga incremental si existe; si no, lo calcula por
+    bloques con el backend del dataset y lo adjunta a la caché incremental.
+    Se guarda en disco con la huella del archivo para compararlo más
+    adelante sin volver a leerlo.
+    """
+    state = metadata.get('profile_state')
+    if state is None:
+        state = ProfileState.from_frame(df, backend=metadata.get('backend'))
+        metadata['profile_state'] = state
+        if metadata.get('cache_key') is not None:
+            ProfileCache.attach_state(metadata['cache_key'], metadata['fingerprint'], state)
+    if not ProfileStore.exists(metadata['fingerprint']):
+        ProfileStore.save(metadata['fingerprint'], metadata['filename'], state)
+    return state
+
+
+def get_nullity() -> NullityMask:
+    """Calcula (una sola vez por dataset) la máscara de nulos y sus derivaciones"""
+    if st.session_state.nullity is None:
+        st.session_state.nullity = with_derivations(NullityMask.from_frame(
+            st.session_state.df,
+            backend=st.session_state.metadata.get('backend')
+        ))
+    return st.session_state.nullity
+
+
+def get_outliers() -> dict:
+    """Detecta outliers (una sola vez por dataset) reutilizando el profiling"""
+    if st.session_state.outliers is None:
+        df = st.session_state.df
+        metadata = st.session_state.metadata
+        state = metadata.get('profile_state')
+        
+        # Pasada 1 solo si la carga no dejó estadísticas suficientes
+        if state is not None:
+            stats = OutlierStats.from_profile(state, df, backend=metadata.get('backend'))
+        else:
+            stats = OutlierStats.from_frame(df, backend=metadata.get('backend'))
+        
+        st.session_state.outliers = detect_outliers(df, stats, backend=metadata.get('backend'))
+    return st.session_state.outliers
 
 
 def display_sidebar():
@@ -49,6 +193,8 @@ def display_sidebar():
         - {', '.join([f"{ext.upper()}" for ext in SUPPORTED_EXTENSIONS.keys()])}
         
         **Límite de tamaño:** {MAX_FILE_SIZE_MB}MB
+        
+        **Backend:** {DATAFRAME_BACKEND}
         """)
         
         st.markdown("---")
@@ -58,6 +204,11 @@ def display_sidebar():
             if st.button("🔄 Cargar nuevo dataset"):
                 st.session_state.df = None
                 st.session_state.metadata = None
+                st.session_state.profile = None
+                st.session_state.nullity = None
+                st.session_state.outliers = None
+                st.session_state.reference = None
+                st.session_state.analysis = new_analysis()
                 st.session_state.file_loaded = False
                 st.rerun()
         else:
@@ -68,6 +219,16 @@ def display_upload_section():
     """Muestra la sección de carga de archivos"""
     st.header("📁 Cargar Dataset")
     
+    source = st.radio(
+        "Origen de datos",
+        ["Subir archivo", "Ruta del servidor"],
+        horizontal=True
+    )
+    
+    if source == "Ruta del servidor":
+        display_server_path_section()
+        return
+    
     uploaded_file = st.file_uploader(
         "Arrastra tu archivo aquí o haz clic para seleccionar",
         type=list(SUPPORTED_EXTENSIONS.keys()),
@@ -77,28 +238,53 @@ def display_upload_section():
     if uploaded_file is not None:
         with st.spinner("⏳ Cargando y validando archivo..."):
             df, metadata, error = FileHandler.load_file(uploaded_file)
-            
-            if error:
-                st.error(f"❌ {error}")
-                return
-            
-            # Guardar en session state
-            st.session_state.df = df
-            st.session_state.metadata = metadata
-            st.session_state.file_loaded = True
-            
-            st.success(MSG_UPLOAD_SUCCESS)
-            st.rerun()
+            store_loaded_dataset(df, metadata, error)
 
 
-def display_dataset_info():
-    """Muestra información básica del dataset"""
-    if not st.session_state.file_loaded:
+def display_server_path_section():
+    """Muestra la carga de archivos que ya existen en el servidor"""
+    server_files = FileHandler.list_server_files()
+    
+    st.caption(
+        "Directorios permitidos: "
+        + ", ".join(f"`{root}`" for root in SERVER_DATA_ROOTS)
+    )
+    
+    selected = st.selectbox(
+        "Archivos disponibles",
+        options=[None] + server_files,
+        format_func=lambda p: "— Escribir ruta manualmente —" if p is None else str(p)
+    )
+    custom_path = st.text_input("Ruta del archivo", value="" if selected is None else str(selected))
+    
+    if st.button("📂 Cargar desde ruta") and custom_path:
+        with st.spinner("⏳ Mapeando y cargando archivo..."):
+            df, metadata, error = FileHandler.load_from_path(custom_path)
+            store_loaded_dataset(df, metadata, error)
+
+
+def store_loaded_dataset(df, metadata, error):
+    """Guarda el dataset cargado en session state o muestra el error"""
+    if error:
+        st.error(f"❌ {error}")
         return
     
-    df = st.session_state.df
-    metadata = st.session_state.metadata
+    # Guardar en session state
+    st.session_state.df = df
+    st.session_state.metadata = metadata
+    st.session_state.profile = None
+    st.session_state.nullity = None
+    st.session_state.outliers = None
+    st.session_state.reference = None
+    st.session_state.analysis = new_analysis()
+    st.session_state.file_loaded = True
     
+    st.success(MSG_UPLOAD_SUCCESS)
+    st.rerun()
+
+
+def display_dataset_info(metadata: dict):
+    """Muestra información básica del dataset"""
     st.header("📋 Información del Dataset")
     
     # Metadata en columnas
@@ -113,18 +299,19 @@ def display_dataset_info():
     with col4:
         st.metric("Formato", metadata['extension'].upper())
     
+    if metadata.get('load_mode') == 'append':
+        st.info(f"⚡ Carga incremental: solo se procesaron {metadata['new_rows']:,} filas nuevas")
+    elif metadata.get('load_mode') == 'unchanged':
+        reused = "el parseo y el profiling" if metadata.get('profile_state') is not None else "el parseo"
+        st.info(f"⚡ El archivo no cambió desde la última carga: se reutilizó {reused}")
+    
     # Información adicional
     with st.expander("🔍 Detalles técnicos"):
-        info_df = get_dataframe_info(df)
-        
         col_a, col_b = st.columns(2)
         
         with col_a:
-            st.markdown("**Uso de memoria:**")
-            st.text(f"{info_df['memory_usage_mb']} MB")
-            
-            st.markdown("**Duplicados:**")
-            st.text(f"{info_df['duplicates']} filas")
+            st.markdown("**Backend:**")
+            st.text(metadata.get('backend', 'pandas'))
         
         with col_b:
             if metadata['extension'] == 'csv':
@@ -135,13 +322,8 @@ def display_dataset_info():
                 st.text(repr(metadata.get('separator', ',')))
 
 
-def display_preview():
+def display_preview(head: pd.DataFrame):
     """Muestra preview del dataset"""
-    if not st.session_state.file_loaded:
-        return
-    
-    df = st.session_state.df
-    
     st.header("👀 Preview de Datos")
     
     # Controles de preview
@@ -158,22 +340,471 @@ def display_preview():
     
     # Mostrar preview
     st.dataframe(
-        df.head(num_rows),
+        head.head(num_rows),
         use_container_width=True,
         height=400
     )
-    
-    # Información de columnas
+
+
+def display_dtypes(kinds: dict):
+    """Muestra el tipo lógico de cada columna (solo esquema)"""
     with st.expander("📊 Tipos de datos"):
-        dtypes_df = pd.DataFrame({
-            'Columna': df.columns,
-            'Tipo': df.dtypes.values,
-            'No Nulos': df.count().values,
-            '% Nulos': ((df.isnull().sum() / len(df)) * 100).round(2).values
-        })
+        st.dataframe(
+            pd.DataFrame({'Columna': list(kinds), 'Tipo': list(kinds.values())}),
+            use_container_width=True,
+            hide_index=True
+        )
+
+
+def display_sampled_notice(name: str, sample_rows: int):
+    """Aviso de resultado aproximado con opción de calcularlo completo"""
+    col1, col2 = st.columns([4, 1])
+    
+    with col1:
+        st.caption(
+            f"⚡ Estimado sobre una muestra de {sample_rows:,} filas: la versión completa "
+            f"no cabía en el presupuesto de {ANALYSIS_TIME_BUDGET_S} s del dataset"
+        )
+    with col2:
+        if st.button("🎯 Calcular exacto", key=f"exact_{name}"):
+            st.session_state.analysis['exact'].add(name)
+            st.rerun()
+
+
+def display_statistics(profile: dict, sampled: bool):
+    """Muestra nulos, duplicados y estadísticas por columna"""
+    st.header("📈 Estadísticas")
+    
+    if sampled:
+        display_sampled_notice('profile', profile['shape'][0])
+    
+    rows = max(profile['shape'][0], 1)
+    columns = profile['columns']
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Filas duplicadas", f"{profile['duplicates']:,}")
+    with col2:
+        cells = rows * max(len(columns), 1)
+        st.metric("% Celdas nulas", f"{round(sum(profile['missing_values'].values()) / cells * 100, 2)}%")
+    with col3:
+        memory = profile['memory_usage_mb']
+        st.metric("Memoria", "N/A" if memory is None or sampled else f"{memory} MB")
+    
+    numeric = profile['numeric']
+    stats_df = pd.DataFrame({
+        'Columna': columns,
+        'Tipo': [str(profile['dtypes'][col]) for col in columns],
+        'No Nulos': [profile['non_null'][col] for col in columns],
+        '% Nulos': [round(profile['missing_values'][col] / rows * 100, 2) for col in columns],
+        'Media': [numeric.get(col, {}).get('mean') for col in columns],
+        'Std': [numeric.get(col, {}).get('std') for col in columns],
+        'Mín': [numeric.get(col, {}).get('min') for col in columns],
+        'Máx': [numeric.get(col, {}).get('max') for col in columns]
+    })
+    
+    st.dataframe(
+        stats_df,
+        use_container_width=True,
+        hide_index=True
+    )
+
+
+def display_missing_data(nullity: NullityMask, sampled: bool):
+    """Muestra el análisis de valores faltantes"""
+    st.header("🕳️ Valores Faltantes")
+    
+    if sampled:
+        display_sampled_notice('nullity', nullity.rows)
+    
+    columns_with_nulls = nullity.columns_with_nulls()
+    
+    if not columns_with_nulls:
+        st.success("✅ El dataset no tiene valores faltantes")
+        return
+    
+    completeness = nullity.row_completeness()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Columnas con nulos", len(columns_with_nulls))
+    with col2:
+        st.metric("Filas completas", f"{completeness['complete_rows']:,}")
+    with col3:
+        st.metric("% Filas completas", f"{completeness['complete_percent']}%")
+    with col4:
+        st.metric("Completitud media", f"{completeness['mean_completeness']}%")
+    
+    with st.expander("🧩 Patrones de faltantes más frecuentes"):
+        patterns = nullity.patterns()
+        patterns['columns'] = patterns['columns'].apply(
+            lambda cols: ', '.join(map(str, cols)) if cols else '(fila completa)'
+        )
+        st.dataframe(
+            patterns.rename(columns={
+                'columns': 'Columnas nulas',
+                'rows': 'Filas',
+                'percent': '% Filas'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with st.expander("🔗 Co-ocurrencia de nulos entre columnas"):
+        st.caption("Filas en que ambas columnas son nulas (diagonal: nulos de la columna)")
+        st.dataframe(nullity.co_occurrence(), use_container_width=True)
+    
+    with st.expander("📉 Nulos por fila"):
+        st.bar_chart(completeness['histogram'])
+        st.caption(f"Máscara de nulidad: {nullity.memory_mb} MB (1 bit por celda)")
+
+
+def display_outliers(result: dict, sampled: bool):
+    """Muestra la detección de outliers (IQR, z-score y MAD)"""
+    st.header("🎯 Outliers")
+    
+    if not result['columns']:
+        st.info("ℹ️ El dataset no tiene columnas numéricas")
+        return
+    
+    if sampled:
+        display_sampled_notice('outliers', result['rows'])
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Filas con outliers (IQR)", f"{result['iqr']['rows_flagged']:,}")
+    with col2:
+        st.metric("Filas con outliers (z-score)", f"{result['zscore']['rows_flagged']:,}")
+    with col3:
+        st.metric("Filas con outliers (MAD)", f"{result['mad']['rows_flagged']:,}")
+    
+    if not result['exact']:
+        st.caption("Cuantiles (IQR y MAD) estimados sobre una muestra uniforme de filas")
+    
+    summary = outlier_summary(result)
+    st.dataframe(
+        summary.rename(columns={
+            'column': 'Columna',
+            'method': 'Método',
+            'lower': 'Límite inferior',
+            'upper': 'Límite superior',
+            'count': 'Outliers',
+            'percent': '% Filas'
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Las posiciones se refieren a la muestra si el resultado es aproximado
+    if sampled:
+        rows_df = get_sample()
+    elif st.session_state.metadata.get('backend', 'pandas') == 'pandas':
+        rows_df = st.session_state.df
+    else:
+        return
+    
+    with st.expander("🔎 Filas de ejemplo"):
+        column = st.selectbox("Columna", result['columns'])
+        method = st.selectbox("Método", ['iqr', 'zscore', 'mad'])
+        positions = result[method]['sample_rows'][column]
+        if positions:
+            st.dataframe(rows_df.iloc[positions], use_container_width=True)
+        else:
+            st.text("Sin outliers para esta combinación")
+
+
+def build_analysis_tasks() -> list:
+    """
+    Tareas del EDA con prioridad y costo estimado para el planificador
+    
+    Lo barato (metadata, preview, tipos) va primero y sin variante
+    aproximada. Las tareas ya calculadas cuestan 0; las que ya se
+    resolvieron con la muestra se mantienen aproximadas salvo que el
+    usuario pida la versión exacta.
+    
+    Returns:
+        list: AnalysisTask en cualquier orden
+    """
+    df = st.session_state.df
+    metadata = st.session_state.metadata
+    analysis = st.session_state.analysis
+    backend = get_backend(metadata.get('backend'))
+    
+    rows, columns = metadata['rows'], metadata['columns']
+    has_state = metadata.get('profile_state') is not None
+    # Con carga incremental la tarea de profiling construye el ProfileState
+    profile_task = 'profile_state' if metadata.get('cache_key') is not None else 'profile'
+    one_pass = has_state and OutlierStats.profile_covers(metadata['profile_state'])
+    kinds = backend.column_kinds(df)
+    numeric = sum(kind == 'numeric' for kind in kinds.values())
+    
+    def cost(name: str, done, estimate: float) -> float:
+        if done is not None:
+            return 0.0
+        if analysis['modes'].get(name) == 'sampled':
+            return float('inf')
+        return estimate
+    
+    return [
+        AnalysisTask('metadata', 0, 0.0, lambda: metadata),
+        AnalysisTask('preview', 1, 0.0, lambda: backend.head(df, 100)),
+        AnalysisTask('dtypes', 2, 0.0, lambda: kinds),
+        AnalysisTask(
+            'profile', 3,
+            cost('profile', st.session_state.profile,
+                 0.0 if has_state else estimate_cost(profile_task, rows, columns, backend.name)),
+            get_profile, lambda: get_sampled('profile')
+        ),
+        AnalysisTask(
+            'nullity', 4,
+            cost('nullity', st.session_state.nullity, estimate_cost('nullity', rows, columns, backend.name)),
+            get_nullity, lambda: get_sampled('nullity')
+        ),
+        AnalysisTask(
+            'outliers', 5,
+            # Si la muestra del profiling alcanza, solo hace falta la pasada de marcado
+            cost('outliers', st.session_state.outliers,
+                 estimate_cost('outliers', rows, numeric, backend.name) * (1 if one_pass else 2)),
+            get_outliers, lambda: get_sampled('outliers')
+        )
+    ]
+
+
+def display_comparison():
+    """Compara el dataset actual con otro ya perfilado (drift)"""
+    if not st.session_state.file_loaded:
+        return
+    
+    st.header("🔀 Comparar Datasets")
+    
+    metadata = st.session_state.metadata
+    source = st.radio(
+        "Dataset de referencia",
+        ["Perfil guardado", "Subir archivo"],
+        horizontal=True
+    )
+    
+    if source == "Perfil guardado":
+        entries = [e for e in ProfileStore.entries() if e['fingerprint'] != metadata['fingerprint']]
+        if not entries:
+            st.info("ℹ️ No hay otros datasets perfilados todavía")
+            return
         
+        st.caption("⚠️ Los perfiles guardados incluyen una muestra de filas del dataset")
+        if st.button("🗑️ Borrar perfiles guardados"):
+            removed = ProfileStore.clear()
+            st.session_state.reference = None
+            st.success(f"✅ {removed} perfiles borrados")
+            return
+        
+        entry = st.selectbox(
+            "Perfiles guardados",
+            options=entries,
+            format_func=lambda e: f"{e['name']} · {e['rows']:,} filas · {e['saved_at']}"
+        )
+        if st.button("🔀 Comparar"):
+            st.session_state.reference = (entry['name'], ProfileStore.load(entry['fingerprint']))
+    else:
+        uploaded_file = st.file_uploader(
+            "Archivo de referencia",
+            type=list(SUPPORTED_EXTENSIONS.keys()),
+            key="reference_file"
+        )
+        if uploaded_file is not None and st.button("🔀 Comparar"):
+            with st.spinner("⏳ Perfilando archivo de referencia..."):
+                # Sin caché incremental: una referencia con el mismo nombre
+                # no debe reemplazar la entrada del dataset activo
+                ref_df, ref_metadata, error = FileHandler.load_file(uploaded_file, incremental=False)
+                if error:
+                    st.error(f"❌ {error}")
+                    return
+                # En la sesión solo queda el profiling, no el DataFrame
+                st.session_state.reference = (ref_metadata['filename'], get_profile_state(ref_df, ref_metadata))
+    
+    if st.session_state.reference is None:
+        return
+    
+    name, reference = st.session_state.reference
+    drift = compare_profiles(reference, get_profile_state(st.session_state.df, metadata))
+    ref_rows, cur_rows = drift['rows']
+    
+    st.caption(f"Referencia: **{name}** ({ref_rows:,} filas) → actual: **{metadata['filename']}** ({cur_rows:,} filas)")
+    
+    schema = drift['schema']
+    changed = schema[schema['status'] != 'igual']
+    drifted = pd.concat([drift['numeric'], drift['categorical']])
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Cambios de esquema", len(changed))
+    with col2:
+        st.metric("Columnas con drift significativo", int((drifted['severity'] == 'significativo').sum()))
+    with col3:
+        st.metric("Columnas con drift moderado", int((drifted['severity'] == 'moderado').sum()))
+    
+    with st.expander("🧱 Esquema", expanded=len(changed) > 0):
+        st.dataframe(
+            schema.rename(columns={
+                'column': 'Columna',
+                'status': 'Estado',
+                'type_ref': 'Tipo referencia',
+                'type_cur': 'Tipo actual'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with st.expander("📈 Drift numérico", expanded=True):
+        st.caption("PSI sobre deciles de la referencia y KS sobre histogramas binados de las muestras")
+        st.dataframe(
+            drift['numeric'].rename(columns={
+                'column': 'Columna',
+                'psi': 'PSI',
+                'ks': 'KS',
+                'mean_ref': 'Media referencia',
+                'mean_cur': 'Media actual',
+                'mean_shift_std': 'Desplazamiento (std)',
+                'severity': 'Drift'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with st.expander("🏷️ Drift categórico", expanded=True):
+        st.dataframe(
+            drift['categorical'].rename(columns={
+                'column': 'Columna',
+                'psi': 'PSI',
+                'top_shift_category': 'Categoría con mayor cambio',
+                'top_shift': 'Cambio de proporción',
+                'categories': 'Categorías',
+                'severity': 'Drift'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with st.expander("🕳️ Cambios en nulos"):
+        st.dataframe(
+            drift['nulls'].rename(columns={
+                'column': 'Columna',
+                'null_rate_ref': '% Nulos referencia',
+                'null_rate_cur': '% Nulos actual',
+                'change': 'Cambio (pp)'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
+
+
+def display_export():
+    """Exporta el reporte HTML a outputs/"""
+    if not st.session_state.file_loaded:
+        return
+    
+    st.header("📤 Exportar Reporte")
+    
+    st.caption("⚠️ La caché de secciones guarda los valores más frecuentes de cada columna")
+    if st.button("🗑️ Borrar caché de reportes"):
+        st.success(f"✅ {FragmentCache.clear()} secciones borradas")
+    
+    if not st.button("📄 Generar reporte HTML"):
+        return
+    
+    metadata = st.session_state.metadata
+    backend = get_backend(metadata.get('backend'))
+    
+    with st.spinner("⏳ Generando reporte..."):
+        sections = build_sections(
+            st.session_state.df,
+            metadata,
+            get_profile(),
+            nullity=get_nullity(),
+            outliers=get_outliers(),
+            profile_state=metadata.get('profile_state')
+        )
+        result = export_html(
+            sections,
+            title=f"EDA - {metadata['filename']}",
+            max_workers=REPORT_MAX_WORKERS if backend.thread_safe else 1
+        )
+    
+    cached = sum(t['cached'] for t in result['timings'])
+    st.success(
+        f"✅ Reporte generado en {result['total_seconds']} s "
+        f"({cached}/{len(result['timings'])} secciones desde caché): {result['path']}"
+    )
+    
+    with st.expander("⏱️ Tiempos por sección"):
+        st.dataframe(pd.DataFrame(result['timings']), use_container_width=True, hide_index=True)
+    
+    with open(result['path'], 'rb') as f:
+        st.download_button(
+            "⬇️ Descargar HTML",
+            data=f,
+            file_name=result['path'].name,
+            mime="text/html"
+        )
+
+
+def display_analysis():
+    """
+    Ejecuta el EDA con el planificador y va mostrando cada sección
+    
+    Cada sección tiene un lugar fijo en la página; se llena apenas termina
+    su tarea, así que lo barato aparece de inmediato y lo caro después.
+    """
+    analysis = st.session_state.analysis
+    renderers = {
+        'metadata': lambda result, sampled: display_dataset_info(result),
+        'preview': lambda result, sampled: display_preview(result),
+        'dtypes': lambda result, sampled: display_dtypes(result),
+        'profile': display_statistics,
+        'nullity': display_missing_data,
+        'outliers': display_outliers
+    }
+    
+    slots = {}
+    for name in renderers:
+        slots[name] = st.empty()
+        if name != 'preview':
+            st.markdown("---")
+    
+    scheduler = AnalysisScheduler(spent=analysis['spent'])
+    for task in build_analysis_tasks():
+        if task.cost > 0:
+            slots[task.name].info("⏳ Calculando...")
+        scheduler.add(task)
+    
+    for done in scheduler.run(force_full=analysis['exact']):
+        name = done['name']
+        analysis['modes'][name] = done['mode']
+        if done['seconds'] or name not in analysis['timings']:
+            analysis['timings'][name] = {key: value for key, value in done.items() if key != 'result'}
+        analysis['spent'] = scheduler.spent
+        
+        with slots[name].container():
+            renderers[name](done['result'], done['mode'] == 'sampled')
+
+
+def display_timings():
+    """Tiempos por tarea del planificador"""
+    analysis = st.session_state.analysis
+    
+    with st.expander("⏱️ Tiempos de análisis"):
+        st.caption(f"Presupuesto usado: {round(analysis['spent'], 2)} / {ANALYSIS_TIME_BUDGET_S} s")
+        timings = pd.DataFrame(list(analysis['timings'].values()), columns=['name', 'mode', 'seconds', 'estimate'])
         st.dataframe(
-            dtypes_df,
+            timings.rename(columns={
+                'name': 'Tarea',
+                'mode': 'Modo',
+                'seconds': 'Segundos',
+                'estimate': 'Estimado completo'
+            }),
             use_container_width=True,
             hide_index=True
         )
@@ -193,7 +824,8 @@ def main():
         st.markdown("""
         ### 📖 Cómo usar
         
-        1. **Sube tu dataset** en formato CSV o Excel
+        1. **Sube tu dataset** en formato CSV o Excel, o elige un archivo
+           que ya esté en el servidor (se carga con memory mapping, sin copias)
         2. El sistema automáticamente:
            - Detectará el formato y encoding
            - Validará la estructura
@@ -208,10 +840,12 @@ def main():
         - ⏳ Fase 5: Export y deployment
         """)
     else:
-        # Mostrar información y preview
-        display_dataset_info()
+        # Secciones del EDA por prioridad, dentro del presupuesto de tiempo
+        display_analysis()
+        display_comparison()
         st.markdown("---")
-        display_preview()
+        display_export()
+        display_timings()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ Utilidades para EDA Automated
 """
 
 from .file_handler import FileHandler, get_dataframe_info
+from .backends import DataFrameBackend, get_backend
+from .missing import NullityMask
 from .config import *
 
-__all__ = ['FileHandler', 'get_dataframe_info']
\ No newline at end of file
+__all__ = ['FileHandler', 'get_dataframe_info', 'DataFrameBackend', 'get_backend', 'NullityMask']
\ No newline at end of file
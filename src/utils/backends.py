@@ -0,0 +1,614 @@
+"""
+Backends de DataFrame para carga y profiling
+
+Cada backend expone la misma interfaz (leer, contar, preview y profiling)
+sobre un motor distinto:
+
+- pandas: eager, el comportamiento original del proyecto
+- polars: LazyFrame multi-hilo; filtros, selección de columnas y
+  agregaciones se empujan al scan y nunca se materializa el dataset
+- duckdb: relaciones lazy ejecutadas por el motor vectorizado de DuckDB
+
+polars y duckdb son dependencias opcionales: solo se importan al
+seleccionar el backend correspondiente.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Iterator, Optional
+from .config import CSV_INFER_SCHEMA_ROWS, DATAFRAME_BACKEND
+
+
+def _column_kind(dtype_name: str) -> str:
+    """
+    Normaliza un nombre de tipo de cualquier motor a una categoría lógica
+
+    Args:
+        dtype_name: Nombre del tipo (pandas, polars o duckdb)
+
+    Returns:
+        str: 'numeric', 'bool', 'datetime', 'string' u 'other'
+    """
+    name = dtype_name.lower()
+
+    if name.startswith('bool'):
+        return 'bool'
+    if name.startswith(('timedelta', 'duration', 'interval')):
+        return 'other'
+    if name.startswith(('int', 'uint', 'float', 'bigint', 'smallint', 'tinyint',
+                        'hugeint', 'ubigint', 'usmallint', 'utinyint', 'uinteger',
+                        'double', 'real', 'decimal')):
+        return 'numeric'
+    if name.startswith(('datetime', 'date', 'timestamp', 'time')):
+        return 'datetime'
+    if name.startswith(('object', 'str', 'string', 'varchar', 'categorical', 'category', 'enum')):
+        return 'string'
+    return 'other'
+
+
+def _as_float(value) -> Optional[float]:
+    """Convierte a float nativo (None/NaN -> None)"""
+    if value is None or pd.isna(value):
+        return None
+    return float(value)
+
+
+def _is_utf8(encoding: str) -> bool:
+    """Indica si el encoding es utf-8 (o ascii, su subconjunto)"""
+    return encoding.lower().replace('-', '').replace('_', '') in ('utf8', 'ascii')
+
+
+def _quote(column: str) -> str:
+    """Escapa un nombre de columna como identificador SQL"""
+    return '"' + str(column).replace('"', '""') + '"'
+
+
+class DataFrameBackend:
+    """Interfaz común de los backends"""
+
+    name = 'base'
+    lazy = False
+    # Si un mismo frame puede consultarse desde varios hilos a la vez
+    thread_safe = True
+
+    def read_csv(self, source, separator: str, encoding: str):
+        """
+        Lee un CSV
+
+        Args:
+            source: Path de un archivo o buffer binario (BytesIO)
+            separator: Separador de columnas
+            encoding: Encoding del archivo
+
+        Returns:
+            Frame nativo del backend
+        """
+        raise NotImplementedError
+
+    def is_decode_error(self, error: Exception) -> bool:
+        """
+        Indica si un error de read_csv se debe al encoding
+
+        Solo esos errores justifican reintentar con otro encoding: un error
+        de tipos reintentado como latin-1 podría "funcionar" y mostrar el
+        texto corrupto.
+
+        Args:
+            error: Excepción lanzada por read_csv
+
+        Returns:
+            bool: True si el archivo no se pudo decodificar
+        """
+        # LookupError: encoding detectado que Python no conoce
+        return isinstance(error, (UnicodeError, LookupError))
+
+    def read_excel(self, source):
+        """
+        Lee un Excel (siempre vía pandas/openpyxl) y lo convierte al backend
+
+        Args:
+            source: Path o archivo subido
+
+        Returns:
+            Frame nativo del backend
+        """
+        return self.from_pandas(pd.read_excel(source, engine='openpyxl'))
+
+    def from_pandas(self, df: pd.DataFrame):
+        """Convierte un DataFrame de pandas al frame nativo"""
+        raise NotImplementedError
+
+    def to_pandas(self, frame) -> pd.DataFrame:
+        """Materializa el frame completo como DataFrame de pandas"""
+        raise NotImplementedError
+
+    def head(self, frame, n: int) -> pd.DataFrame:
+        """Devuelve las primeras n filas como DataFrame de pandas"""
+        raise NotImplementedError
+
+    def sample(self, frame, n: int) -> pd.DataFrame:
+        """
+        Muestra de hasta n filas repartidas por todo el dataset
+
+        A diferencia de head, no se sesga hacia el inicio del archivo
+        (datos ordenados por fecha, por ejemplo).
+
+        Args:
+            frame: Frame nativo del backend
+            n: Filas máximas de la muestra
+
+        Returns:
+            pd.DataFrame: Muestra como DataFrame de pandas
+        """
+        raise NotImplementedError
+
+    def count_rows(self, frame) -> int:
+        """Cuenta las filas sin materializar los datos"""
+        raise NotImplementedError
+
+    def column_names(self, frame) -> list:
+        """Nombres de columnas en orden"""
+        raise NotImplementedError
+
+    def column_kinds(self, frame) -> dict:
+        """Categoría lógica de cada columna, solo a partir del esquema"""
+        raise NotImplementedError
+
+    def null_batches(self, frame, columns: list, batch_rows: int) -> Iterator[np.ndarray]:
+        """
+        Máscara de nulos por bloques de filas, en una sola pasada
+
+        Args:
+            frame: Frame nativo del backend
+            columns: Columnas a incluir
+            batch_rows: Filas aproximadas por bloque
+
+        Yields:
+            np.ndarray: Matriz bool (filas del bloque x columnas)
+        """
+        for batch in self.iter_batches(frame, columns, batch_rows):
+            yield batch.isna().to_numpy()
+
+    def iter_batches(self, frame, columns: list, batch_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Recorre las columnas pedidas en bloques de filas, en orden
+
+        Args:
+            frame: Frame nativo del backend
+            columns: Columnas a incluir
+            batch_rows: Filas aproximadas por bloque
+
+        Yields:
+            pd.DataFrame: Bloques de pandas (nunca el dataset completo)
+        """
+        raise NotImplementedError
+
+    def profile(self, frame) -> dict:
+        """
+        Calcula metadata y estadísticas básicas
+
+        Args:
+            frame: Frame nativo del backend
+
+        Returns:
+            dict: shape, columns, dtypes, kinds, memory_usage_mb (None si es
+                lazy), missing_values, non_null, duplicates y numeric
+                (count, mean, std, min, max por columna numérica)
+        """
+        raise NotImplementedError
+
+
+class PandasBackend(DataFrameBackend):
+    """Backend eager con pandas (por defecto)"""
+
+    name = 'pandas'
+    lazy = False
+
+    def read_csv(self, source, separator: str, encoding: str):
+        # Con un Path, pandas mapea el archivo (mmap) y parsea directamente
+        # desde el mapeo, sin copiarlo a bytes (y respetando el encoding)
+        return pd.read_csv(
+            source,
+            sep=separator,
+            encoding=encoding,
+            low_memory=False,
+            memory_map=isinstance(source, Path)
+        )
+
+    def read_excel(self, source):
+        return pd.read_excel(source, engine='openpyxl')
+
+    def from_pandas(self, df: pd.DataFrame):
+        return df
+
+    def to_pandas(self, frame) -> pd.DataFrame:
+        return frame
+
+    def head(self, frame, n: int) -> pd.DataFrame:
+        return frame.head(n)
+
+    def sample(self, frame, n: int) -> pd.DataFrame:
+        step = max(len(frame) // max(n, 1), 1)
+        return frame.iloc[::step].head(n)
+
+    def count_rows(self, frame) -> int:
+        return len(frame)
+
+    def column_names(self, frame) -> list:
+        return frame.columns.tolist()
+
+    def column_kinds(self, frame) -> dict:
+        return {col: _column_kind(str(dtype)) for col, dtype in frame.dtypes.items()}
+
+    def iter_batches(self, frame, columns: list, batch_rows: int) -> Iterator[pd.DataFrame]:
+        for start in range(0, len(frame), batch_rows):
+            yield frame.iloc[start:start + batch_rows][columns]
+
+    def profile(self, frame) -> dict:
+        df = frame
+        non_null = df.count()
+        numeric_cols = [
+            col for col in df.columns
+            if _column_kind(str(df[col].dtype)) == 'numeric'
+        ]
+
+        numeric = {}
+        if numeric_cols:
+            stats = df[numeric_cols].agg(['count', 'mean', 'std', 'min', 'max'])
+            numeric = {
+                col: {stat: _as_float(stats.at[stat, col]) for stat in stats.index}
+                for col in numeric_cols
+            }
+
+        return {
+            'shape': df.shape,
+            'columns': df.columns.tolist(),
+            'dtypes': df.dtypes.to_dict(),
+            'kinds': {col: _column_kind(str(dtype)) for col, dtype in df.dtypes.items()},
+            'memory_usage_mb': round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+            'missing_values': (len(df) - non_null).to_dict(),
+            'non_null': non_null.to_dict(),
+            'duplicates': int(df.duplicated().sum()),
+            'numeric': numeric
+        }
+
+
+class PolarsBackend(DataFrameBackend):
+    """Backend lazy con Polars LazyFrame"""
+
+    name = 'polars'
+    lazy = True
+
+    def __init__(self):
+        import polars as pl
+        self.pl = pl
+
+    def read_csv(self, source, separator: str, encoding: str):
+        # Tipos inferidos con las primeras filas y validados con una pasada
+        # paralela por todo el archivo (también expone errores de encoding).
+        # Si un valor posterior no encaja (p.ej. 'abc' tras miles de enteros)
+        # se infiere con el archivo completo: la columna queda texto, como
+        # en pandas, en vez de fallar al perfilar.
+        try:
+            frame = self._scan(source, separator, encoding, CSV_INFER_SCHEMA_ROWS)
+            frame.select(self.pl.all().null_count()).collect()
+        except self.pl.exceptions.ComputeError as e:
+            if self.is_decode_error(e):
+                raise
+            frame = self._scan(source, separator, encoding, None)
+            frame.head(1000).collect()
+        return frame
+
+    def _scan(self, source, separator: str, encoding: str, infer_rows: Optional[int]):
+        """LazyFrame del CSV con infer_rows filas para inferir tipos (None = todas)"""
+        pl = self.pl
+        utf8 = _is_utf8(encoding)
+
+        if isinstance(source, Path) and utf8:
+            # scan_csv mapea el archivo y solo lee lo que pide el plan
+            return pl.scan_csv(source, separator=separator, infer_schema_length=infer_rows)
+
+        # Polars solo decodifica utf8 en el scan: otros encodings se leen eager
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pl.read_csv(
+            source,
+            separator=separator,
+            encoding=encoding if not utf8 else 'utf8',
+            infer_schema_length=infer_rows
+        ).lazy()
+
+    def is_decode_error(self, error: Exception) -> bool:
+        return super().is_decode_error(error) or (
+            isinstance(error, self.pl.exceptions.ComputeError) and 'utf-8' in str(error)
+        )
+
+    def from_pandas(self, df: pd.DataFrame):
+        return self.pl.from_pandas(df).lazy()
+
+    def to_pandas(self, frame) -> pd.DataFrame:
+        return frame.collect().to_pandas()
+
+    def head(self, frame, n: int) -> pd.DataFrame:
+        return frame.head(n).collect().to_pandas()
+
+    def sample(self, frame, n: int) -> pd.DataFrame:
+        step = max(self.count_rows(frame) // max(n, 1), 1)
+        return frame.gather_every(step).head(n).collect().to_pandas()
+
+    def count_rows(self, frame) -> int:
+        return frame.select(self.pl.len()).collect().item()
+
+    def column_names(self, frame) -> list:
+        return frame.collect_schema().names()
+
+    def column_kinds(self, frame) -> dict:
+        return {col: _column_kind(str(dtype)) for col, dtype in frame.collect_schema().items()}
+
+    def null_batches(self, frame, columns: list, batch_rows: int) -> Iterator[np.ndarray]:
+        # is_null en el motor: los valores (p.ej. texto) nunca pasan a pandas
+        nulls = frame.select([self.pl.col(col).is_null() for col in columns])
+        for batch in nulls.collect_batches(chunk_size=batch_rows):
+            yield batch.to_numpy()
+
+    def iter_batches(self, frame, columns: list, batch_rows: int) -> Iterator[pd.DataFrame]:
+        for batch in frame.select(columns).collect_batches(chunk_size=batch_rows):
+            yield batch.to_pandas()
+
+    def profile(self, frame) -> dict:
+        pl = self.pl
+        schema = frame.collect_schema()
+        columns = schema.names()
+        kinds = {col: _column_kind(str(dtype)) for col, dtype in schema.items()}
+        numeric_cols = [col for col in columns if kinds[col] == 'numeric']
+
+        exprs = [pl.len().alias('__rows')]
+        exprs += [pl.col(col).null_count().alias(f'__null_{i}') for i, col in enumerate(columns)]
+        for i, col in enumerate(numeric_cols):
+            c = pl.col(col).cast(pl.Float64)
+            exprs += [
+                c.mean().alias(f'__mean_{i}'),
+                c.std().alias(f'__std_{i}'),
+                c.min().alias(f'__min_{i}'),
+                c.max().alias(f'__max_{i}')
+            ]
+
+        # Un solo plan para ambas consultas: el scan se comparte
+        stats, unique = pl.collect_all([
+            frame.select(exprs),
+            frame.unique().select(pl.len())
+        ])
+        row = stats.row(0, named=True)
+        rows = row['__rows']
+
+        missing = {col: row[f'__null_{i}'] for i, col in enumerate(columns)}
+        non_null = {col: rows - missing[col] for col in columns}
+        numeric = {
+            col: {
+                'count': float(non_null[col]),
+                'mean': _as_float(row[f'__mean_{i}']),
+                'std': _as_float(row[f'__std_{i}']),
+                'min': _as_float(row[f'__min_{i}']),
+                'max': _as_float(row[f'__max_{i}'])
+            }
+            for i, col in enumerate(numeric_cols)
+        }
+
+        return {
+            'shape': (rows, len(columns)),
+            'columns': columns,
+            'dtypes': dict(schema.items()),
+            'kinds': kinds,
+            'memory_usage_mb': None,
+            'missing_values': missing,
+            'non_null': non_null,
+            'duplicates': rows - unique.item(),
+            'numeric': numeric
+        }
+
+
+class DuckDBBackend(DataFrameBackend):
+    """Backend lazy con relaciones de DuckDB"""
+
+    name = 'duckdb'
+    lazy = True
+    # Una misma relación (y su conexión) no admite consultas concurrentes
+    thread_safe = False
+
+    # Misma inferencia que pandas: sin detección automática de fechas
+    TYPE_CANDIDATES = ['BOOLEAN', 'BIGINT', 'DOUBLE', 'VARCHAR']
+
+    def __init__(self):
+        import duckdb
+        self.duckdb = duckdb
+        self.con = duckdb.connect()
+        # Cada frame tiene su propio cursor (conexión a la misma base en
+        # memoria): las sesiones de Streamlit corren en hilos distintos y una
+        # sola conexión compartida se bloquea con consultas concurrentes. El
+        # cursor vive mientras exista el frame.
+        self._cursors = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _owned(self, build):
+        """Crea un frame con build(cursor) sobre un cursor nuevo"""
+        with self._lock:
+            cursor = self.con.cursor()
+        frame = build(cursor)
+        with self._lock:
+            self._cursors[frame] = cursor
+        return frame
+
+    @staticmethod
+    def _spool(buffer) -> Path:
+        """Copia un buffer binario a un archivo temporal"""
+        buffer.seek(0)
+        with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
+            shutil.copyfileobj(buffer, f)
+        return Path(f.name)
+
+    def read_csv(self, source, separator: str, encoding: str):
+        if not _is_utf8(encoding):
+            # El lector de DuckDB solo decodifica utf-8 sin extensiones extra
+            return self.from_pandas(PandasBackend().read_csv(source, separator, encoding))
+
+        # Los buffers en memoria se vuelcan a un temporal: leerlos con fsspec
+        # registra un filesystem por base de datos y falla desde el segundo
+        # cursor. El temporal vive mientras exista el frame (lectura lazy).
+        path = source if isinstance(source, Path) else self._spool(source)
+
+        # Tipos del sniffer sobre las primeras filas, validados con una pasada
+        # por todo el archivo; si un valor posterior no encaja (p.ej. 'abc'
+        # tras miles de enteros) se vuelve a inferir con todo el archivo
+        # (sample_size=-1) y la columna queda VARCHAR, como en pandas
+        frame = self._read(path, separator, CSV_INFER_SCHEMA_ROWS)
+        try:
+            frame.aggregate(', '.join(f'count({_quote(col)})' for col in frame.columns)).fetchall()
+        except self.duckdb.ConversionException:
+            frame = self._read(path, separator, -1)
+
+        if path is not source:
+            weakref.finalize(frame, os.unlink, path)
+        return frame
+
+    def _read(self, path: Path, separator: str, sample_size: int):
+        """Relación sobre el CSV con sample_size filas para el sniffer (-1 = todas)"""
+        return self._owned(lambda cursor: cursor.read_csv(
+            str(path),
+            sep=separator,
+            header=True,
+            sample_size=sample_size,
+            auto_type_candidates=self.TYPE_CANDIDATES
+        ))
+
+    def is_decode_error(self, error: Exception) -> bool:
+        return super().is_decode_error(error) or (
+            isinstance(error, self.duckdb.InvalidInputException) and 'not utf-8 encoded' in str(error)
+        )
+
+    def from_pandas(self, df: pd.DataFrame):
+        return self._owned(lambda cursor: cursor.from_df(df))
+
+    def to_pandas(self, frame) -> pd.DataFrame:
+        return frame.df()
+
+    def head(self, frame, n: int) -> pd.DataFrame:
+        return frame.limit(n).df()
+
+    def sample(self, frame, n: int) -> pd.DataFrame:
+        return frame.query('t', f'SELECT * FROM t USING SAMPLE reservoir({int(n)} ROWS) REPEATABLE (0)').df()
+
+    def count_rows(self, frame) -> int:
+        return frame.aggregate('count(*)').fetchone()[0]
+
+    def column_names(self, frame) -> list:
+        return list(frame.columns)
+
+    def column_kinds(self, frame) -> dict:
+        return {col: _column_kind(str(dtype)) for col, dtype in zip(frame.columns, frame.dtypes)}
+
+    def null_batches(self, frame, columns: list, batch_rows: int) -> Iterator[np.ndarray]:
+        # IS NULL en el motor: los valores (p.ej. texto) nunca pasan a pandas
+        relation = frame.project(', '.join(
+            f'{_quote(col)} IS NULL AS __null_{i}' for i, col in enumerate(columns)
+        ))
+        vectors = max(batch_rows // 2048, 1)
+        while True:
+            batch = relation.fetch_df_chunk(vectors)
+            if batch.empty:
+                break
+            yield batch.to_numpy(dtype=bool)
+
+    def iter_batches(self, frame, columns: list, batch_rows: int) -> Iterator[pd.DataFrame]:
+        # DuckDB entrega vectores de 2048 filas
+        relation = frame.project(', '.join(_quote(col) for col in columns))
+        vectors = max(batch_rows // 2048, 1)
+        while True:
+            batch = relation.fetch_df_chunk(vectors)
+            if batch.empty:
+                break
+            yield batch
+
+    def profile(self, frame) -> dict:
+        columns = list(frame.columns)
+        dtypes = {col: str(dtype) for col, dtype in zip(columns, frame.dtypes)}
+        kinds = {col: _column_kind(dtype) for col, dtype in dtypes.items()}
+        numeric_cols = [col for col in columns if kinds[col] == 'numeric']
+
+        exprs = ['count(*)'] + [f'count({_quote(col)})' for col in columns]
+        for col in numeric_cols:
+            c = f'CAST({_quote(col)} AS DOUBLE)'
+            exprs += [f'avg({c})', f'stddev_samp({c})', f'min({c})', f'max({c})']
+
+        values = frame.aggregate(', '.join(exprs)).fetchone()
+        unique = frame.distinct().aggregate('count(*)').fetchone()[0]
+
+        rows = values[0]
+        non_null = {col: values[1 + i] for i, col in enumerate(columns)}
+        offset = 1 + len(columns)
+        numeric = {}
+        for i, col in enumerate(numeric_cols):
+            mean, std, min_, max_ = values[offset + 4 * i: offset + 4 * i + 4]
+            numeric[col] = {
+                'count': float(non_null[col]),
+                'mean': _as_float(mean),
+                'std': _as_float(std),
+                'min': _as_float(min_),
+                'max': _as_float(max_)
+            }
+
+        return {
+            'shape': (rows, len(columns)),
+            'columns': columns,
+            'dtypes': dtypes,
+            'kinds': kinds,
+            'memory_usage_mb': None,
+            'missing_values': {col: rows - non_null[col] for col in columns},
+            'non_null': non_null,
+            'duplicates': rows - unique,
+            'numeric': numeric
+        }
+
+
+BACKENDS = {
+    'pandas': PandasBackend,
+    'polars': PolarsBackend,
+    'duckdb': DuckDBBackend,
+}
+
+_instances = {}
+
+
+def get_backend(name: Optional[str] = None) -> DataFrameBackend:
+    """
+    Obtiene el backend configurado (una instancia por proceso)
+
+    Args:
+        name: Nombre del backend; si es None se usa DATAFRAME_BACKEND
+
+    Returns:
+        DataFrameBackend: Instancia del backend
+
+    Raises:
+        ValueError: Si el backend no existe
+        ImportError: Si falta la dependencia opcional del backend
+    """
+    name = (name or DATAFRAME_BACKEND).lower()
+
+    if name not in BACKENDS:
+        raise ValueError(f"Backend no soportado: {name}. Use: {', '.join(BACKENDS)}")
+
+    if name not in _instances:
+        try:
+            _instances[name] = BACKENDS[name]()
+        except ImportError as e:
+            raise ImportError(
+                f"El backend '{name}' requiere instalar '{name}' (pip install {name})"
+            ) from e
+
+    return _instances[name]
@@ -2,6 +2,12 @@
 Configuración y constantes del proyecto EDA Automated
 """
 
+import os
+from pathlib import Path
+
+# Raíz del proyecto (src/utils/config.py -> raíz)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 # Límites de archivos
 MAX_FILE_SIZE_MB = 50
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
@@ -15,6 +21,79 @@ SUPPORTED_EXTENSIONS = {
 # Configuración de lectura CSV
 CSV_ENCODINGS = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
 CSV_SEPARATORS = [',', ';', '\t', '|']
+# Filas con que polars/duckdb infieren tipos; si el resto del archivo no
+# encaja, se vuelve a inferir con el archivo completo
+CSV_INFER_SCHEMA_ROWS = 10000
+
+# Carga desde rutas del servidor (memory-mapped, sin copia en memoria)
+# Directorios permitidos: data/samples + los de EDA_SERVER_ROOTS (separados por os.pathsep)
+SERVER_DATA_ROOTS = [PROJECT_ROOT / 'data' / 'samples'] + [
+    Path(root) for root in os.environ.get('EDA_SERVER_ROOTS', '').split(os.pathsep) if root
+]
+MAX_SERVER_FILE_SIZE_MB = 4096
+MAX_SERVER_FILE_SIZE_BYTES = MAX_SERVER_FILE_SIZE_MB * 1024 * 1024
+
+# Bytes iniciales usados para detectar encoding y separador
+ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Backend de DataFrame: 'pandas' (eager), 'polars' (LazyFrame) o 'duckdb'
+DATAFRAME_BACKEND = os.environ.get('EDA_BACKEND', 'pandas')
+
+# Profiling incremental (datasets append-only, solo backend pandas)
+INCREMENTAL_PROFILING = True
+# Bloque de lectura para el hash del archivo completo (huella)
+FINGERPRINT_BLOCK_BYTES = 1024 * 1024
+# La caché retiene DataFrames completos en memoria del proceso
+PROFILE_CACHE_MAX_ENTRIES = 4
+PROFILE_CACHE_MAX_MB = 2048
+PROFILE_SAMPLE_ROWS = 10000
+FREQUENCY_SKETCH_SIZE = 64
+HLL_PRECISION = 12
+
+# Análisis de faltantes (máscara de nulidad de 1 bit por celda)
+NULLITY_BLOCK_ROWS = 65536
+MISSING_TOP_PATTERNS = 10
+
+# Detección de outliers
+OUTLIER_IQR_FACTOR = 1.5
+OUTLIER_ZSCORE_THRESHOLD = 3.0
+OUTLIER_MAD_THRESHOLD = 3.5
+OUTLIER_CHUNK_ROWS = 100000
+OUTLIER_QUANTILE_SAMPLE = 100000   # cuantiles exactos hasta este número de filas
+OUTLIER_SAMPLE_ROWS = 20           # índices de ejemplo por columna y método
+
+# Export de reportes (Fase 5)
+OUTPUTS_DIR = PROJECT_ROOT / 'outputs'
+REPORT_CACHE_DIR = OUTPUTS_DIR / '.cache' / 'fragments'
+REPORT_CACHE_MAX_ENTRIES = 500    # fragmentos en disco (se borran los menos usados)
+REPORT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+REPORT_BATCH_ROWS = 100000
+REPORT_HISTOGRAM_BINS = 30
+REPORT_TOP_VALUES = 10
+
+# Comparación de datasets / drift
+PROFILE_STORE_DIR = OUTPUTS_DIR / '.cache' / 'profiles'
+PROFILE_STORE_MAX_ENTRIES = 50     # perfiles en disco (se borran los más antiguos)
+DRIFT_PSI_BINS = 10
+DRIFT_KS_BINS = 50
+DRIFT_PSI_WARNING = 0.1
+DRIFT_PSI_ALERT = 0.25
+
+# Planificador de análisis (render progresivo)
+ANALYSIS_TIME_BUDGET_S = 3.0
+ANALYSIS_SAMPLE_ROWS = 50000
+# Costo estimado de la variante completa de cada tarea, en ns por celda,
+# por backend: con polars y duckdb cada tarea vuelve a escanear el CSV
+# (profile_state: ProfileState mergeable, con hashes de filas y sketches,
+#  solo con carga incremental, es decir pandas;
+#  nullity: máscara + patrones, co-ocurrencia y completitud por fila;
+#  outliers: por celda numérica y por pasada)
+# (se recalibra con los tiempos medidos durante la ejecución)
+ANALYSIS_COST_NS_PER_CELL = {
+    'pandas': {'profile': 100, 'profile_state': 330, 'nullity': 40, 'outliers': 40},
+    'polars': {'profile': 150, 'nullity': 80, 'outliers': 90},
+    'duckdb': {'profile': 250, 'nullity': 120, 'outliers': 140}
+}
 
 # Configuración de preview
 PREVIEW_ROWS = 10
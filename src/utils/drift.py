@@ -0,0 +1,430 @@
+"""
+Comparación de datasets y drift a partir de profilings guardados
+
+Los ProfileState de cada dataset cargado se guardan en disco (sin los
+hashes de filas, que solo sirven para duplicados) con la huella del
+archivo como clave, en formatos planos: arrays en .npz (leídos sin
+pickle) y la estructura y los valores de texto como JSON. Se conservan
+los PROFILE_STORE_MAX_ENTRIES más recientes. Ojo: cada perfil incluye
+filas crudas (la muestra uniforme de PROFILE_SAMPLE_ROWS filas) y los top
+valores de cada columna, así que el directorio contiene datos del
+dataset, no solo estadísticas.
+
+Comparar dos datasets ya perfilados usa solo esos resúmenes y sketches,
+sin volver a leer filas:
+
+- Esquema: columnas agregadas, eliminadas y con cambio de tipo
+- Numéricas: PSI (bins por deciles de la referencia) y KS sobre
+  histogramas binados de las muestras de filas, más desplazamiento de media
+- Categóricas: PSI y mayor cambio de proporción sobre los top valores
+- Nulos: cambio en la tasa de nulos por columna
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import List, Optional
+from .config import (
+    DRIFT_KS_BINS,
+    DRIFT_PSI_ALERT,
+    DRIFT_PSI_BINS,
+    DRIFT_PSI_WARNING,
+    PROFILE_STORE_DIR,
+    PROFILE_STORE_MAX_ENTRIES
+)
+from .incremental import MOMENTS, ProfileState
+from .sketches import FrequencySketch, HyperLogLog, RowSample
+
+# Suavizado para bins vacíos en PSI
+_EPSILON = 1e-4
+
+# Categoría que agrupa lo que no está en los top valores de ningún dataset
+OTHER = '(otros)'
+
+
+def _plain(value):
+    """Valor de pandas/numpy a un tipo que JSON guarda tal cual"""
+    if value is None or (not isinstance(value, (list, tuple, np.ndarray)) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return {'timestamp': value.isoformat()}
+    return str(value)
+
+
+def _restore(value):
+    """Inversa de _plain"""
+    if isinstance(value, dict) and 'timestamp' in value:
+        return pd.Timestamp(value['timestamp'])
+    return value
+
+
+def _restore_dtype(name: str):
+    """Dtype de pandas a partir de su nombre (el nombre si pandas no lo reconoce)"""
+    try:
+        return pd.api.types.pandas_dtype(name)
+    except TypeError:
+        return name
+
+
+def _encode_state(state: ProfileState) -> dict:
+    """
+    ProfileState a arrays planos para np.savez (sin objetos de Python)
+
+    Los arrays numéricos, booleanos y de fechas van tal cual; la estructura,
+    los top valores y las columnas de texto de la muestra van en 'structure'
+    como JSON.
+    """
+    columns = list(state.columns)
+    frequency_columns = [col for col in columns if col in state.frequencies]
+    arrays = {
+        f'moments_{key}': np.asarray(state.moments[key], dtype=np.float64) for key in MOMENTS
+    }
+    arrays['hll'] = (
+        np.stack([state.distinct[col].registers for col in columns])
+        if columns else np.empty((0, 0), dtype=np.uint8)
+    )
+    arrays['sample_priorities'] = state.sample.priorities
+
+    sample_text = {}
+    for i, col in enumerate(columns):
+        values = state.sample.values.get(col)
+        if values is None:
+            continue
+        if values.dtype.kind in 'biufmM':
+            arrays[f'sample_{i}'] = values
+        else:
+            sample_text[i] = [_plain(value) for value in values]
+
+    structure = {
+        'rows': int(state.rows),
+        'columns': columns,
+        'dtypes': [str(state.dtypes[col]) for col in columns],
+        'nulls': [int(state.nulls[col]) for col in columns],
+        'numeric_columns': [columns.index(col) for col in state.numeric_columns],
+        'duplicates': int(state.duplicates),
+        'hll_precision': state.distinct[columns[0]].p if columns else None,
+        'frequencies': [
+            {
+                'column': columns.index(col),
+                'k': state.frequencies[col].k,
+                'total': int(state.frequencies[col].total),
+                'counts': [[_plain(value), int(count)] for value, count in state.frequencies[col].counts.items()]
+            }
+            for col in frequency_columns
+        ],
+        'sample_k': state.sample.k,
+        'sample_text': {str(i): values for i, values in sample_text.items()}
+    }
+    arrays['structure'] = np.array(json.dumps(structure))
+    return arrays
+
+
+def _decode_state(arrays) -> ProfileState:
+    """Inversa de _encode_state (sin hashes de filas)"""
+    structure = json.loads(str(arrays['structure']))
+    columns = structure['columns']
+
+    state = ProfileState()
+    state.rows = structure['rows']
+    state.columns = columns
+    state.dtypes = {col: _restore_dtype(name) for col, name in zip(columns, structure['dtypes'])}
+    state.nulls = dict(zip(columns, structure['nulls']))
+    state.numeric_columns = [columns[i] for i in structure['numeric_columns']]
+    state.moments = {key: arrays[f'moments_{key}'] for key in MOMENTS}
+    state.duplicates = structure['duplicates']
+
+    for col, registers in zip(columns, arrays['hll']):
+        sketch = HyperLogLog(structure['hll_precision'])
+        sketch.registers = registers
+        state.distinct[col] = sketch
+
+    for entry in structure['frequencies']:
+        sketch = FrequencySketch(entry['k'])
+        sketch.total = entry['total']
+        sketch.counts = {_restore(value): count for value, count in entry['counts']}
+        state.frequencies[columns[entry['column']]] = sketch
+
+    state.sample = RowSample(structure['sample_k'])
+    state.sample.priorities = arrays['sample_priorities']
+    for i, col in enumerate(columns):
+        if f'sample_{i}' in arrays:
+            state.sample.values[col] = arrays[f'sample_{i}']
+        elif str(i) in structure['sample_text']:
+            values = np.empty(len(structure['sample_text'][str(i)]), dtype=object)
+            values[:] = [_restore(value) for value in structure['sample_text'][str(i)]]
+            state.sample.values[col] = values
+
+    return state
+
+
+class ProfileStore:
+    """
+    Profilings guardados en disco, uno por huella de archivo
+
+    Retención: al guardar se borran los perfiles más antiguos por encima de
+    PROFILE_STORE_MAX_ENTRIES. Los archivos guardan filas crudas de la
+    muestra del ProfileState; clear() los elimina todos.
+    """
+
+    @staticmethod
+    def save(fingerprint: str, name: str, state: ProfileState):
+        """
+        Guarda el profiling de un dataset
+
+        Args:
+            fingerprint: Huella del archivo (metadata['fingerprint'])
+            name: Nombre visible (nombre de archivo)
+            state: Estado de profiling
+        """
+        PROFILE_STORE_DIR.mkdir(parents=True, exist_ok=True)
+
+        info = {
+            'fingerprint': fingerprint,
+            'name': name,
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'rows': state.rows,
+            'columns': len(state.columns)
+        }
+
+        # El estado va en .npz y la info en .json (listar no carga estados)
+        path = PROFILE_STORE_DIR / f'{fingerprint}.npz'
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'wb') as f:
+            np.savez(f, **_encode_state(state))
+        tmp.replace(path)
+        path.with_suffix('.json').write_text(json.dumps(info), encoding='utf-8')
+
+        ProfileStore._prune()
+
+    @staticmethod
+    def load(fingerprint: str) -> Optional[ProfileState]:
+        """Estado de profiling guardado (sin hashes de filas), o None"""
+        path = PROFILE_STORE_DIR / f'{fingerprint}.npz'
+        if not path.exists():
+            return None
+        # allow_pickle=False: un archivo manipulado no puede ejecutar código
+        with np.load(path, allow_pickle=False) as arrays:
+            return _decode_state(arrays)
+
+    @staticmethod
+    def exists(fingerprint: str) -> bool:
+        """Si ya hay un profiling guardado con esa huella"""
+        return (PROFILE_STORE_DIR / f'{fingerprint}.npz').exists()
+
+    @staticmethod
+    def entries() -> List[dict]:
+        """Info de los profilings guardados, del más reciente al más antiguo"""
+        if not PROFILE_STORE_DIR.exists():
+            return []
+
+        entries = [
+            json.loads(path.read_text(encoding='utf-8'))
+            for path in PROFILE_STORE_DIR.glob('*.json')
+            if path.with_suffix('.npz').exists()
+        ]
+        return sorted(entries, key=lambda entry: entry['saved_at'], reverse=True)
+
+    @staticmethod
+    def clear() -> int:
+        """
+        Borra todos los profilings guardados
+
+        Returns:
+            int: Cantidad de perfiles borrados
+        """
+        entries = ProfileStore.entries()
+        for entry in entries:
+            ProfileStore._remove(entry['fingerprint'])
+        # Perfiles del formato anterior (pickle): ya no se leen, pero se borran
+        if PROFILE_STORE_DIR.exists():
+            for path in PROFILE_STORE_DIR.glob('*.pkl'):
+                ProfileStore._remove(path.stem)
+        return len(entries)
+
+    @staticmethod
+    def _prune():
+        """Borra los perfiles más antiguos por encima del límite"""
+        for entry in ProfileStore.entries()[PROFILE_STORE_MAX_ENTRIES:]:
+            ProfileStore._remove(entry['fingerprint'])
+
+    @staticmethod
+    def _remove(fingerprint: str):
+        """Borra el estado y la info de un perfil"""
+        for suffix in ('.npz', '.pkl', '.json'):
+            (PROFILE_STORE_DIR / f'{fingerprint}{suffix}').unlink(missing_ok=True)
+
+
+def psi(reference: np.ndarray, current: np.ndarray) -> float:
+    """
+    Population Stability Index entre dos distribuciones de proporciones
+
+    Args:
+        reference: Proporciones de la referencia por bin
+        current: Proporciones actuales por bin
+
+    Returns:
+        float: PSI (< 0.1 estable, 0.1-0.25 moderado, > 0.25 significativo)
+    """
+    reference = np.clip(reference, _EPSILON, None)
+    current = np.clip(current, _EPSILON, None)
+    return float(np.sum((current - reference) * np.log(current / reference)))
+
+
+def _shares(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Proporción de valores por bin"""
+    counts = np.histogram(values, bins=edges)[0].astype(np.float64)
+    total = counts.sum()
+    return counts / total if total else counts
+
+
+def _sample_values(state: ProfileState, column: str) -> np.ndarray:
+    """Valores numéricos no nulos de la muestra de filas"""
+    values = state.sample.values.get(column)
+    if values is None:
+        return np.empty(0)
+    values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+    return values[~np.isnan(values)]
+
+
+def _numeric_drift(reference: ProfileState, current: ProfileState, column: str) -> dict:
+    """PSI, KS binado y desplazamiento de media de una columna numérica"""
+    ref_values = _sample_values(reference, column)
+    cur_values = _sample_values(current, column)
+    ref_stats = reference.numeric_summary(column)
+    cur_stats = current.numeric_summary(column)
+
+    result = {
+        'column': column,
+        'psi': None,
+        'ks': None,
+        'mean_ref': ref_stats['mean'],
+        'mean_cur': cur_stats['mean'],
+        'mean_shift_std': None
+    }
+
+    if ref_stats['mean'] is not None and cur_stats['mean'] is not None and ref_stats['std']:
+        result['mean_shift_std'] = (cur_stats['mean'] - ref_stats['mean']) / ref_stats['std']
+
+    if not len(ref_values) or not len(cur_values):
+        return result
+
+    # PSI: bins por deciles de la referencia, abiertos en los extremos
+    inner = np.unique(np.quantile(ref_values, np.linspace(0, 1, DRIFT_PSI_BINS + 1)[1:-1]))
+    edges = np.concatenate([[-np.inf], inner, [np.inf]])
+    result['psi'] = psi(_shares(ref_values, edges), _shares(cur_values, edges))
+
+    # KS: máxima diferencia entre CDFs sobre bins finos del rango conjunto
+    low = min(ref_values.min(), cur_values.min())
+    high = max(ref_values.max(), cur_values.max())
+    if high > low:
+        edges = np.linspace(low, high, DRIFT_KS_BINS + 1)
+        ref_cdf = np.cumsum(_shares(ref_values, edges))
+        cur_cdf = np.cumsum(_shares(cur_values, edges))
+        result['ks'] = float(np.max(np.abs(ref_cdf - cur_cdf)))
+    else:
+        result['ks'] = 0.0
+
+    return result
+
+
+def _categorical_drift(reference: ProfileState, current: ProfileState, column: str) -> dict:
+    """PSI y mayor cambio de proporción sobre los top valores (Misra-Gries)"""
+    ref_sketch = reference.frequencies[column]
+    cur_sketch = current.frequencies[column]
+    categories = sorted(set(ref_sketch.counts) | set(cur_sketch.counts), key=str)
+
+    def shares(sketch) -> np.ndarray:
+        total = max(sketch.total, 1)
+        values = np.array([sketch.counts.get(cat, 0) / total for cat in categories])
+        return np.append(values, max(1 - values.sum(), 0.0))
+
+    ref_shares, cur_shares = shares(ref_sketch), shares(cur_sketch)
+    shift = cur_shares - ref_shares
+    labels = [str(cat) for cat in categories] + [OTHER]
+    largest = int(np.argmax(np.abs(shift))) if len(shift) else 0
+
+    return {
+        'column': column,
+        'psi': psi(ref_shares, cur_shares) if ref_sketch.total and cur_sketch.total else None,
+        'top_shift_category': labels[largest],
+        'top_shift': float(shift[largest]) if len(shift) else 0.0,
+        'categories': len(categories)
+    }
+
+
+def _severity(value: Optional[float]) -> str:
+    """Clasificación del PSI"""
+    if value is None:
+        return '—'
+    if value >= DRIFT_PSI_ALERT:
+        return 'significativo'
+    if value >= DRIFT_PSI_WARNING:
+        return 'moderado'
+    return 'estable'
+
+
+def compare_profiles(reference: ProfileState, current: ProfileState) -> dict:
+    """
+    Compara dos datasets a partir de sus profilings
+
+    Args:
+        reference: Profiling de referencia (p.ej. la semana anterior)
+        current: Profiling actual
+
+    Returns:
+        dict: schema, numeric, categorical y nulls (DataFrames) y rows
+            (filas de cada dataset)
+    """
+    ref_kinds, cur_kinds = reference.kinds, current.kinds
+
+    schema = []
+    for col in list(reference.columns) + [c for c in current.columns if c not in ref_kinds]:
+        ref_type = str(reference.dtypes[col]) if col in ref_kinds else None
+        cur_type = str(current.dtypes[col]) if col in cur_kinds else None
+        if ref_type is None:
+            status = 'agregada'
+        elif cur_type is None:
+            status = 'eliminada'
+        elif ref_kinds[col] != cur_kinds[col]:
+            status = 'cambio de tipo'
+        else:
+            status = 'igual'
+        schema.append({'column': col, 'status': status, 'type_ref': ref_type, 'type_cur': cur_type})
+
+    common = [col for col in reference.columns if col in cur_kinds]
+
+    numeric, categorical, nulls = [], [], []
+    for col in common:
+        ref_rate = reference.nulls[col] / max(reference.rows, 1)
+        cur_rate = current.nulls[col] / max(current.rows, 1)
+        nulls.append({
+            'column': col,
+            'null_rate_ref': round(ref_rate * 100, 2),
+            'null_rate_cur': round(cur_rate * 100, 2),
+            'change': round((cur_rate - ref_rate) * 100, 2)
+        })
+
+        if ref_kinds[col] != cur_kinds[col]:
+            continue
+        if col in reference.numeric_columns and col in current.numeric_columns:
+            numeric.append(_numeric_drift(reference, current, col))
+        elif col in reference.frequencies and col in current.frequencies:
+            categorical.append(_categorical_drift(reference, current, col))
+
+    numeric_df = pd.DataFrame(numeric, columns=['column', 'psi', 'ks', 'mean_ref', 'mean_cur', 'mean_shift_std'])
+    categorical_df = pd.DataFrame(categorical, columns=['column', 'psi', 'top_shift_category', 'top_shift', 'categories'])
+    for df in (numeric_df, categorical_df):
+        df['severity'] = df['psi'].map(_severity)
+
+    return {
+        'rows': (reference.rows, current.rows),
+        'schema': pd.DataFrame(schema, columns=['column', 'status', 'type_ref', 'type_cur']),
+        'numeric': numeric_df,
+        'categorical': categorical_df,
+        'nulls': pd.DataFrame(nulls, columns=['column', 'null_rate_ref', 'null_rate_cur', 'change'])
+    }
@@ -2,16 +2,24 @@
 Módulo para manejo de carga y validación de archivos
 """
 
+import mmap
 import pandas as pd
 import chardet
 from io import BytesIO
-from typing import Tuple, Optional
+from pathlib import Path
+from typing import Tuple, Optional, List
 from .config import (
     MAX_FILE_SIZE_BYTES,
+    MAX_SERVER_FILE_SIZE_BYTES,
+    INCREMENTAL_PROFILING,
     CSV_ENCODINGS,
     CSV_SEPARATORS,
+    ENCODING_SAMPLE_BYTES,
+    SERVER_DATA_ROOTS,
     SUPPORTED_EXTENSIONS
 )
+from .backends import DataFrameBackend, get_backend
+from .incremental import dataset_fingerprint, load_incremental
 
 
 class FileHandler:
@@ -86,80 +94,244 @@ class FileHandler:
         return max(separator_counts, key=separator_counts.get)
     
     @staticmethod
-    def load_csv(file, encoding: Optional[str] = None) -> Tuple[pd.DataFrame, dict]:
+    def load_csv(file, encoding: Optional[str] = None,
+                 backend: Optional[str] = None,
+                 incremental: bool = True) -> Tuple[pd.DataFrame, dict]:
         """
         Carga un archivo CSV
         
         Args:
             file: Archivo subido
             encoding: Encoding a usar (opcional)
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+            incremental: Usar y actualizar la caché incremental (ProfileCache)
             
         Returns:
-            Tuple[pd.DataFrame, dict]: DataFrame y metadata
+            Tuple[pd.DataFrame, dict]: DataFrame (o frame nativo del backend) y metadata
         """
+        backend = get_backend(backend)
         file_bytes = file.read()
         file.seek(0)  # Reset pointer
         
-        # Detectar encoding si no se proporciona
-        if encoding is None:
-            encoding = FileHandler.detect_encoding(file_bytes)
+        df, metadata = FileHandler._load_csv_data(
+            file_bytes, BytesIO(file_bytes), file.name, file_bytes, encoding, backend, incremental
+        )
+        metadata['file_size_mb'] = round(file.size / (1024 * 1024), 2)
         
-        # Detectar separador
-        separator = FileHandler.detect_csv_separator(file_bytes, encoding)
+        return df, metadata
+    
+    @staticmethod
+    def _load_csv_data(data, source, key: str, sample: bytes, encoding: Optional[str],
+                       backend: DataFrameBackend,
+                       incremental: bool = True) -> Tuple[pd.DataFrame, dict]:
+        """
+        Detecta formato y parsea un CSV, de forma incremental si es posible
+        
+        Con el backend pandas, si el archivo extiende a una versión cargada
+        antes (mismo key y mismo prefijo), solo se parsean las filas nuevas
+        y se combina su profiling con el guardado (ver incremental.py). La
+        carga no calcula profiling: metadata['cache_key'] permite adjuntarlo
+        a la caché cuando se calcule.
+        
+        Args:
+            data: bytes o mmap con el contenido completo
+            source: Fuente para el parseo completo (Path o BytesIO)
+            key: Identificador del dataset para la caché incremental
+            sample: Bytes usados para detectar encoding y separador
+            encoding: Encoding a usar (opcional)
+            backend: Backend de DataFrame
+            incremental: Usar y actualizar la caché incremental (ProfileCache)
+            
+        Returns:
+            Tuple[pd.DataFrame, dict]: DataFrame (o frame nativo) y metadata
+        """
+        def full_parse():
+            # Detectar encoding si no se proporciona
+            detected = encoding or FileHandler.detect_encoding(sample)
+            
+            # Detectar separador
+            separator = FileHandler.detect_csv_separator(sample, detected)
+            
+            df, enc = FileHandler._parse_csv(source, separator, detected, backend)
+            return df, enc, separator
+        
+        if incremental and INCREMENTAL_PROFILING and backend.name == 'pandas':
+            df, info, state = load_incremental(data, key, full_parse)
+            enc, separator = info['encoding'], info['separator']
+        else:
+            (df, enc, separator), info, state = full_parse(), None, None
+        
+        metadata = {
+            'encoding': enc,
+            'separator': separator,
+            'rows': backend.count_rows(df),
+            'columns': len(backend.column_names(df)),
+            'backend': backend.name,
+            'fingerprint': info['fingerprint'] if info else dataset_fingerprint(data)
+        }
+        
+        if info is not None:
+            metadata['cache_key'] = key
+            metadata['load_mode'] = info['mode']
+            metadata['new_rows'] = info['new_rows']
+        if state is not None:
+            metadata['profile_state'] = state
+        
+        return df, metadata
+    
+    @staticmethod
+    def _parse_csv(source, separator: str, encoding: str,
+                   backend: DataFrameBackend) -> Tuple[pd.DataFrame, str]:
+        """
+        Parsea un CSV probando el encoding detectado y luego los de respaldo
+        
+        Solo se prueba otro encoding si el error es de decodificación; los
+        demás errores (tipos, formato) se propagan tal cual.
         
-        # Intentar cargar con diferentes encodings
+        Args:
+            source: Path del archivo o buffer binario (BytesIO)
+            separator: Separador de columnas
+            encoding: Encoding detectado
+            backend: Backend que realiza el parseo
+            
+        Returns:
+            Tuple[pd.DataFrame, str]: Frame nativo del backend y encoding usado
+        """
         for enc in [encoding] + CSV_ENCODINGS:
             try:
-                df = pd.read_csv(
-                    BytesIO(file_bytes),
-                    sep=separator,
-                    encoding=enc,
-                    low_memory=False
-                )
-                
-                metadata = {
-                    'encoding': enc,
-                    'separator': separator,
-                    'rows': len(df),
-                    'columns': len(df.columns),
-                    'file_size_mb': round(file.size / (1024 * 1024), 2)
-                }
-                
-                return df, metadata
+                if hasattr(source, 'seek'):
+                    source.seek(0)
+                return backend.read_csv(source, separator, enc), enc
                 
             except Exception as e:
+                if not backend.is_decode_error(e):
+                    raise
                 continue
         
         raise ValueError(f"No se pudo cargar el archivo CSV con ningún encoding")
     
     @staticmethod
-    def load_excel(file) -> Tuple[pd.DataFrame, dict]:
+    def resolve_server_path(path) -> Optional[Path]:
+        """
+        Resuelve una ruta del servidor y verifica que esté en la lista permitida
+        
+        Args:
+            path: Ruta al archivo (str o Path)
+            
+        Returns:
+            Optional[Path]: Ruta absoluta resuelta, o None si está fuera de
+                SERVER_DATA_ROOTS (incluye escapes con '..' o symlinks)
+        """
+        resolved = Path(path).expanduser().resolve()
+        
+        for root in SERVER_DATA_ROOTS:
+            root = Path(root).expanduser().resolve()
+            if resolved == root or root in resolved.parents:
+                return resolved
+        
+        return None
+    
+    @staticmethod
+    def list_server_files() -> List[Path]:
+        """
+        Lista los archivos soportados dentro de los directorios permitidos
+        
+        Cada ruta pasa por resolve_server_path: un symlink dentro de un
+        directorio permitido que apunta afuera no se lista.
+        
+        Returns:
+            List[Path]: Rutas absolutas ordenadas
+        """
+        files = set()
+        for root in SERVER_DATA_ROOTS:
+            root = Path(root).expanduser()
+            if not root.is_dir():
+                continue
+            for extension in SUPPORTED_EXTENSIONS:
+                for p in root.rglob(f'*.{extension}'):
+                    resolved = FileHandler.resolve_server_path(p)
+                    if resolved is not None and resolved.is_file():
+                        files.add(resolved)
+        
+        return sorted(files)
+    
+    @staticmethod
+    def load_csv_from_path(path: Path, encoding: Optional[str] = None,
+                           backend: Optional[str] = None) -> Tuple[pd.DataFrame, dict]:
+        """
+        Carga un CSV del servidor sin copiarlo a un objeto bytes
+        
+        El backend pandas parsea directamente desde un mapeo en memoria
+        (mmap); polars y duckdb escanean el archivo con su lector nativo.
+        Solo los primeros ENCODING_SAMPLE_BYTES se leen para detectar
+        encoding y separador; la huella del archivo se calcula por bloques
+        sobre el mapeo, sin copiarlo completo.
+        
+        Args:
+            path: Ruta absoluta al archivo
+            encoding: Encoding a usar (opcional)
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+            
+        Returns:
+            Tuple[pd.DataFrame, dict]: DataFrame (o frame nativo del backend) y metadata
+        """
+        backend = get_backend(backend)
+        
+        file_size = path.stat().st_size
+        if file_size == 0:
+            raise ValueError("El archivo está vacío")
+        
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            df, metadata = FileHandler._load_csv_data(
+                mapped, path, str(path), mapped[:ENCODING_SAMPLE_BYTES], encoding, backend
+            )
+        metadata['file_size_mb'] = round(file_size / (1024 * 1024), 2)
+        
+        return df, metadata
+    
+    @staticmethod
+    def load_excel(file, backend: Optional[str] = None) -> Tuple[pd.DataFrame, dict]:
         """
         Carga un archivo Excel
         
         Args:
-            file: Archivo subido
+            file: Archivo subido o Path
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
             
         Returns:
-            Tuple[pd.DataFrame, dict]: DataFrame y metadata
+            Tuple[pd.DataFrame, dict]: DataFrame (o frame nativo del backend) y metadata
         """
-        df = pd.read_excel(file, engine='openpyxl')
+        backend = get_backend(backend)
+        df = backend.read_excel(file)
+        
+        if isinstance(file, Path):
+            size = file.stat().st_size
+            fingerprint = dataset_fingerprint(file.read_bytes())
+        else:
+            size = file.size
+            fingerprint = dataset_fingerprint(file.getvalue())
         
         metadata = {
-            'rows': len(df),
-            'columns': len(df.columns),
-            'file_size_mb': round(file.size / (1024 * 1024), 2)
+            'rows': backend.count_rows(df),
+            'columns': len(backend.column_names(df)),
+            'file_size_mb': round(size / (1024 * 1024), 2),
+            'backend': backend.name,
+            'fingerprint': fingerprint
         }
         
         return df, metadata
     
     @staticmethod
-    def load_file(file) -> Tuple[Optional[pd.DataFrame], Optional[dict], Optional[str]]:
+    def load_file(file, backend: Optional[str] = None,
+                  incremental: bool = True) -> Tuple[Optional[pd.DataFrame], Optional[dict], Optional[str]]:
         """
         Carga un archivo (CSV o Excel) automáticamente
         
         Args:
             file: Archivo subido (UploadedFile de Streamlit)
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+            incremental: Usar y actualizar la caché incremental (False para
+                archivos auxiliares que no deben reemplazar al dataset activo)
             
         Returns:
             Tuple[Optional[pd.DataFrame], Optional[dict], Optional[str]]: 
@@ -177,9 +349,9 @@ class FileHandler:
             extension = file.name.split('.')[-1].lower()
             
             if extension == 'csv':
-                df, metadata = FileHandler.load_csv(file)
+                df, metadata = FileHandler.load_csv(file, backend=backend, incremental=incremental)
             elif extension == 'xlsx':
-                df, metadata = FileHandler.load_excel(file)
+                df, metadata = FileHandler.load_excel(file, backend=backend)
             else:
                 return None, None, "Formato no reconocido"
             
@@ -191,25 +363,66 @@ class FileHandler:
             
         except Exception as e:
             return None, None, f"Error al cargar archivo: {str(e)}"
+    
+    @staticmethod
+    def load_from_path(path, backend: Optional[str] = None) -> Tuple[Optional[pd.DataFrame], Optional[dict], Optional[str]]:
+        """
+        Carga un archivo (CSV o Excel) que ya existe en el servidor
+        
+        Args:
+            path: Ruta al archivo, debe estar dentro de SERVER_DATA_ROOTS
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+            
+        Returns:
+            Tuple[Optional[pd.DataFrame], Optional[dict], Optional[str]]: 
+                DataFrame, metadata, y mensaje de error (None si todo OK)
+        """
+        resolved = FileHandler.resolve_server_path(path)
+        if resolved is None:
+            return None, None, "La ruta no está dentro de los directorios permitidos del servidor"
+        
+        if not resolved.is_file():
+            return None, None, f"El archivo no existe: {resolved}"
+        
+        # Validar tamaño (límite propio para archivos locales)
+        if resolved.stat().st_size > MAX_SERVER_FILE_SIZE_BYTES:
+            return None, None, "El archivo excede el límite de tamaño del servidor"
+        
+        # Validar extensión
+        if not FileHandler.validate_file_extension(resolved.name):
+            return None, None, f"Formato no soportado. Use: {', '.join(SUPPORTED_EXTENSIONS.keys())}"
+        
+        try:
+            extension = resolved.suffix.lstrip('.').lower()
+            
+            if extension == 'csv':
+                df, metadata = FileHandler.load_csv_from_path(resolved, backend=backend)
+            elif extension == 'xlsx':
+                # openpyxl lee el zip directamente desde disco
+                df, metadata = FileHandler.load_excel(resolved, backend=backend)
+            else:
+                return None, None, "Formato no reconocido"
+            
+            # Agregar metadata adicional
+            metadata['filename'] = resolved.name
+            metadata['extension'] = extension
+            metadata['path'] = str(resolved)
+            
+            return df, metadata, None
+            
+        except Exception as e:
+            return None, None, f"Error al cargar archivo: {str(e)}"
 
 
-def get_dataframe_info(df: pd.DataFrame) -> dict:
+def get_dataframe_info(df, backend: Optional[str] = None) -> dict:
     """
     Obtiene información básica del DataFrame
     
     Args:
-        df: DataFrame de pandas
+        df: DataFrame de pandas (o frame nativo del backend)
+        backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
         
     Returns:
-        dict: Información del DataFrame
+        dict: Información del DataFrame (ver DataFrameBackend.profile)
     """
-    info = {
-        'shape': df.shape,
-        'columns': df.columns.tolist(),
-        'dtypes': df.dtypes.to_dict(),
-        'memory_usage_mb': round(df.memory_usage(deep=True).sum() / (1024 * 1024), 2),
-        'missing_values': df.isnull().sum().to_dict(),
-        'duplicates': df.duplicated().sum()
-    }
-    
-    return info
\ No newline at end of file
+    return get_backend(backend).profile(df)
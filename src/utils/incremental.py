@@ -0,0 +1,561 @@
+"""
+Profiling incremental para datasets append-only (p.ej. logs CSV diarios)
+
+Cuando un CSV nuevo extiende a uno ya cargado (mismo nombre, mismo
+prefijo de bytes), solo se parsea la cola nueva y su profiling se combina
+con el estado guardado. El costo de la actualización diaria escala con el
+delta, no con el histórico.
+
+La carga solo parsea y calcula la huella: el ProfileState se construye
+después, cuando se necesita (tarea de profiling de la app), y se adjunta
+a la entrada de la caché con ProfileCache.attach_state para que el
+siguiente append lo combine.
+
+El estado del profiling (ProfileState) es mergeable: conteos, nulos,
+momentos (hasta el 4º, fórmulas de Pébay), hashes de filas para
+duplicados y sketches (HyperLogLog, Misra-Gries, muestra de filas).
+"""
+
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+from io import BytesIO
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from .backends import _column_kind, get_backend
+from .config import (
+    FINGERPRINT_BLOCK_BYTES,
+    FREQUENCY_SKETCH_SIZE,
+    HLL_PRECISION,
+    PROFILE_CACHE_MAX_ENTRIES,
+    PROFILE_CACHE_MAX_MB,
+    PROFILE_SAMPLE_ROWS
+)
+from .sketches import FrequencySketch, HyperLogLog, RowSample, hash_values
+
+
+MOMENTS = ('n', 'mean', 'm2', 'm3', 'm4', 'min', 'max')
+
+
+def _chunk_moments(values: np.ndarray) -> dict:
+    """
+    Momentos centrales por columna de una matriz float64 con NaN
+
+    Args:
+        values: Matriz (filas x columnas numéricas)
+
+    Returns:
+        dict: Arrays por columna para cada clave de MOMENTS
+    """
+    valid = ~np.isnan(values)
+    n = valid.sum(axis=0).astype(np.float64)
+    filled = np.where(valid, values, 0.0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = filled.sum(axis=0) / n
+        delta = np.where(valid, values - mean, 0.0)
+        delta2 = delta * delta
+        moments = {
+            'n': n,
+            'mean': np.where(n > 0, mean, 0.0),
+            'm2': delta2.sum(axis=0),
+            'm3': (delta2 * delta).sum(axis=0),
+            'm4': (delta2 * delta2).sum(axis=0),
+            'min': np.where(n > 0, np.where(valid, values, np.inf).min(axis=0, initial=np.inf), np.inf),
+            'max': np.where(n > 0, np.where(valid, values, -np.inf).max(axis=0, initial=-np.inf), -np.inf)
+        }
+
+    return moments
+
+
+def _merge_moments(a: dict, b: dict) -> dict:
+    """Combina momentos de dos particiones (Pébay, 2008), vectorizado por columna"""
+    na, nb = a['n'], b['n']
+    n = na + nb
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        safe_n = np.where(n > 0, n, 1.0)
+        delta = b['mean'] - a['mean']
+        mean = a['mean'] + delta * nb / safe_n
+        m2 = a['m2'] + b['m2'] + delta ** 2 * na * nb / safe_n
+        m3 = (a['m3'] + b['m3']
+              + delta ** 3 * na * nb * (na - nb) / safe_n ** 2
+              + 3 * delta * (na * b['m2'] - nb * a['m2']) / safe_n)
+        m4 = (a['m4'] + b['m4']
+              + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / safe_n ** 3
+              + 6 * delta ** 2 * (na * na * b['m2'] + nb * nb * a['m2']) / safe_n ** 2
+              + 4 * delta * (na * b['m3'] - nb * a['m3']) / safe_n)
+
+    return {
+        'n': n,
+        'mean': mean,
+        'm2': m2,
+        'm3': m3,
+        'm4': m4,
+        'min': np.minimum(a['min'], b['min']),
+        'max': np.maximum(a['max'], b['max'])
+    }
+
+
+def _normalized_row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Hash uint64 por fila, estable entre chunks con dtypes distintos (int/float)"""
+    if df.shape[1] == 0:
+        return np.zeros(len(df), dtype=np.uint64)
+    combined = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for col in df.columns:
+            combined = combined * np.uint64(0x100000001B3) ^ hash_values(df[col])
+    return combined
+
+
+def _insert_hashes(history: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """
+    Agrega hashes únicos y ordenados a un histórico ordenado
+
+    Los ya presentes se encuentran con búsqueda binaria (O(k log n) para k
+    hashes nuevos) y solo se insertan los que faltan, sin volver a ordenar
+    ni deduplicar el histórico.
+
+    Args:
+        history: Hashes únicos ordenados del histórico
+        new: Hashes únicos ordenados del delta
+
+    Returns:
+        np.ndarray: Hashes únicos ordenados de ambos
+    """
+    if not len(history):
+        return new
+    positions = np.searchsorted(history, new)
+    seen = history[np.minimum(positions, len(history) - 1)] == new
+    return np.insert(history, positions[~seen], new[~seen])
+
+
+class ProfileState:
+    """Estado mergeable del profiling de un dataset"""
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = []
+        self.dtypes = {}
+        self.nulls = {}
+        self.numeric_columns = []
+        self.moments = {key: np.empty(0) for key in MOMENTS}
+        # Únicos y ordenados (ver _insert_hashes)
+        self.row_hashes = np.empty(0, dtype=np.uint64)
+        self.duplicates = 0
+        self.distinct = {}
+        self.frequencies = {}
+        self.sample = RowSample(PROFILE_SAMPLE_ROWS)
+
+    @property
+    def kinds(self) -> dict:
+        """Categoría lógica de cada columna ('numeric', 'string', ...)"""
+        return {col: _column_kind(str(dtype)) for col, dtype in self.dtypes.items()}
+
+    @staticmethod
+    def from_dataframe(df: pd.DataFrame, first_row: int = 0) -> 'ProfileState':
+        """
+        Calcula el estado de un chunk
+
+        Args:
+            df: Chunk de pandas
+            first_row: Id global de la primera fila (para la muestra de filas)
+
+        Returns:
+            ProfileState: Estado del chunk
+        """
+        state = ProfileState()
+        state.rows = len(df)
+        state.columns = df.columns.tolist()
+        state.dtypes = df.dtypes.to_dict()
+        state.nulls = df.isnull().sum().to_dict()
+
+        kinds = state.kinds
+        state.numeric_columns = [col for col in state.columns if kinds[col] == 'numeric']
+        if state.numeric_columns:
+            values = df[state.numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            state.moments = _chunk_moments(values)
+
+        hashes = _normalized_row_hashes(df)
+        state.row_hashes = np.unique(hashes)
+        state.duplicates = len(hashes) - len(state.row_hashes)
+
+        for col in state.columns:
+            values = df[col]
+            state.distinct[col] = HyperLogLog(HLL_PRECISION)
+            state.distinct[col].update(hash_values(values.dropna()))
+            if kinds[col] != 'numeric':
+                state.frequencies[col] = FrequencySketch(FREQUENCY_SKETCH_SIZE)
+                state.frequencies[col].update(values)
+
+        state.sample.update(df, first_row)
+        return state
+
+    @staticmethod
+    def from_frame(frame, backend: Optional[str] = None,
+                   batch_rows: int = 100000) -> 'ProfileState':
+        """
+        Calcula el estado de cualquier frame recorriéndolo por bloques
+
+        Args:
+            frame: DataFrame de pandas o frame nativo del backend
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+            batch_rows: Filas por bloque
+
+        Returns:
+            ProfileState: Estado del dataset completo
+        """
+        backend = get_backend(backend)
+        columns = backend.column_names(frame)
+
+        # Los hashes se juntan al final: unirlos bloque a bloque copia
+        # todo el historial en cada merge (cuadrático en el número de bloques)
+        state = None
+        hashes = []
+        for chunk in backend.iter_batches(frame, columns, batch_rows):
+            chunk_state = ProfileState.from_dataframe(chunk, first_row=state.rows if state else 0)
+            hashes.append(chunk_state.row_hashes)
+            chunk_state.row_hashes = np.empty(0, dtype=np.uint64)
+            state = chunk_state if state is None else state.merge(chunk_state)
+
+        if state is None:
+            return ProfileState.from_dataframe(backend.head(frame, 0))
+
+        state.row_hashes = np.unique(np.concatenate(hashes))
+        state.duplicates = state.rows - len(state.row_hashes)
+        return state
+
+    def merge(self, other: 'ProfileState') -> 'ProfileState':
+        """
+        Combina con el estado de las filas siguientes (mismas columnas)
+
+        Args:
+            other: Estado de un chunk posterior
+
+        Returns:
+            ProfileState: Estado del dataset completo
+        """
+        if other.columns != self.columns:
+            raise ValueError("Los chunks no tienen las mismas columnas")
+        if other.numeric_columns != self.numeric_columns:
+            raise ValueError("Los chunks no tienen los mismos tipos de columna")
+
+        merged = ProfileState()
+        merged.rows = self.rows + other.rows
+        merged.columns = self.columns
+        # Dtype resultante de concatenar ambos chunks (p.ej. int64 + float64)
+        merged.dtypes = {
+            col: pd.concat([pd.Series(dtype=self.dtypes[col]), pd.Series(dtype=other.dtypes[col])]).dtype
+            for col in self.columns
+        }
+        merged.nulls = {col: self.nulls[col] + other.nulls[col] for col in self.columns}
+        merged.numeric_columns = self.numeric_columns
+        if self.numeric_columns:
+            merged.moments = _merge_moments(self.moments, other.moments)
+
+        merged.row_hashes = _insert_hashes(self.row_hashes, other.row_hashes)
+        merged.duplicates = merged.rows - len(merged.row_hashes)
+
+        merged.distinct = {col: self.distinct[col].merge(other.distinct[col]) for col in self.columns}
+        merged.frequencies = {
+            col: sketch.merge(other.frequencies[col])
+            for col, sketch in self.frequencies.items()
+        }
+        merged.sample = self.sample.merge(other.sample)
+        return merged
+
+    def numeric_summary(self, column: str) -> dict:
+        """
+        Estadísticas de una columna numérica a partir de los momentos
+
+        Args:
+            column: Columna numérica
+
+        Returns:
+            dict: count, mean, std, min y max (None si no hay valores)
+        """
+        i = self.numeric_columns.index(column)
+        n = self.moments['n'][i]
+        return {
+            'count': float(n),
+            'mean': float(self.moments['mean'][i]) if n > 0 else None,
+            'std': float(np.sqrt(self.moments['m2'][i] / (n - 1))) if n > 1 else None,
+            'min': float(self.moments['min'][i]) if n > 0 else None,
+            'max': float(self.moments['max'][i]) if n > 0 else None
+        }
+
+    def summary(self) -> dict:
+        """
+        Profiling en el mismo formato que DataFrameBackend.profile
+
+        Returns:
+            dict: shape, columns, dtypes, kinds, memory_usage_mb (None),
+                missing_values, non_null, duplicates, numeric y distinct
+        """
+        numeric = {col: self.numeric_summary(col) for col in self.numeric_columns}
+
+        return {
+            'shape': (self.rows, len(self.columns)),
+            'columns': list(self.columns),
+            'dtypes': dict(self.dtypes),
+            'kinds': self.kinds,
+            'memory_usage_mb': None,
+            'missing_values': dict(self.nulls),
+            'non_null': {col: self.rows - self.nulls[col] for col in self.columns},
+            'duplicates': int(self.duplicates),
+            'numeric': numeric,
+            'distinct': {col: sketch.count() for col, sketch in self.distinct.items()}
+        }
+
+
+def _hash_range(data, start: int, end: int, hasher=None):
+    """
+    blake2b de data[start:end] leído por bloques
+
+    Solo se copia un bloque a la vez, así que sirve igual sobre un mmap
+    del archivo que sobre bytes.
+
+    Args:
+        data: bytes o mmap del archivo
+        start: Byte inicial
+        end: Byte final (excluido)
+        hasher: Hash a continuar (opcional, por defecto uno nuevo)
+
+    Returns:
+        Objeto blake2b actualizado (se puede seguir extendiendo)
+    """
+    hasher = hasher or hashlib.blake2b(digest_size=16)
+    for offset in range(start, end, FINGERPRINT_BLOCK_BYTES):
+        hasher.update(data[offset:min(offset + FINGERPRINT_BLOCK_BYTES, end)])
+    return hasher
+
+
+def dataset_fingerprint(data) -> str:
+    """
+    Identificador del contenido de un archivo (para cachés derivadas)
+
+    Args:
+        data: bytes o mmap del archivo
+
+    Returns:
+        str: Hash hexadecimal de todos los bytes del archivo
+    """
+    return _hash_range(data, 0, len(data)).hexdigest()
+
+
+class ProfileCache:
+    """
+    Caché en memoria (LRU) de datasets cargados y su estado de profiling
+
+    Es global al proceso y la comparten todas las sesiones (cada una en su
+    hilo), por eso se protege con un lock. Cada entrada retiene el DataFrame
+    completo aunque su sesión haya terminado: el total se acota a
+    PROFILE_CACHE_MAX_ENTRIES entradas y PROFILE_CACHE_MAX_MB (tamaño
+    aproximado, ver _entry_bytes); un dataset más grande que el límite no
+    se guarda y no tiene carga incremental.
+    """
+
+    _entries = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get(key: str) -> Optional[dict]:
+        """Devuelve la entrada de un dataset (o None)"""
+        with ProfileCache._lock:
+            entry = ProfileCache._entries.get(key)
+            if entry is not None:
+                ProfileCache._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def put(key: str, entry: dict):
+        """Guarda la entrada de un dataset, descartando las más antiguas"""
+        limit = PROFILE_CACHE_MAX_MB * 1024 * 1024
+
+        with ProfileCache._lock:
+            ProfileCache._entries.pop(key, None)
+            if entry['bytes'] > limit:
+                return
+
+            ProfileCache._entries[key] = entry
+            total = sum(e['bytes'] for e in ProfileCache._entries.values())
+            while len(ProfileCache._entries) > PROFILE_CACHE_MAX_ENTRIES or total > limit:
+                _, evicted = ProfileCache._entries.popitem(last=False)
+                total -= evicted['bytes']
+
+    @staticmethod
+    def attach_state(key: str, fingerprint: str, state: ProfileState):
+        """
+        Adjunta el profiling calculado después de la carga
+
+        Solo si la entrada sigue siendo la misma versión del archivo.
+
+        Args:
+            key: Identificador del dataset (el de load_incremental)
+            fingerprint: Huella de la versión perfilada
+            state: Estado de profiling de esa versión
+        """
+        with ProfileCache._lock:
+            entry = ProfileCache._entries.get(key)
+            if entry is not None and entry['hash'] == fingerprint and entry['state'] is None:
+                entry['state'] = state
+                entry['bytes'] += state.row_hashes.nbytes
+
+    @staticmethod
+    def clear():
+        """Vacía la caché"""
+        with ProfileCache._lock:
+            ProfileCache._entries.clear()
+
+
+def _entry_bytes(data, df: pd.DataFrame) -> int:
+    """
+    Tamaño aproximado de una entrada de la caché
+
+    memory_usage sin deep es O(columnas) pero cuenta solo los punteros de
+    las columnas object; el tamaño del archivo acota por abajo el texto.
+    """
+    return max(int(df.memory_usage(deep=False).sum()), len(data))
+
+
+def _extends(entry: dict, data, prefix_hash: str) -> bool:
+    """
+    Indica si data comienza exactamente con el archivo guardado en entry
+
+    Args:
+        entry: Entrada de ProfileCache
+        data: bytes o mmap del archivo nuevo
+        prefix_hash: Hash de data[:length] (length = tamaño anterior)
+    """
+    if len(data) < entry['length'] or prefix_hash != entry['hash']:
+        return False
+
+    length = entry['length']
+
+    # Si el archivo anterior no terminaba en salto de línea, su última fila
+    # podría continuar en los bytes nuevos
+    if len(data) > length and not entry['ends_with_newline']:
+        return data[length:length + 1] in (b'\n', b'\r')
+
+    return True
+
+
+def load_incremental(data, key: str,
+                     full_parse: Callable[[], Tuple[pd.DataFrame, str, str]]) -> Tuple[pd.DataFrame, dict, Optional[ProfileState]]:
+    """
+    Carga un CSV reutilizando el parseo y profiling de una versión anterior
+
+    Una carga completa no calcula profiling. Con append, la cola se
+    combina con el estado de la versión anterior solo si ya se había
+    calculado.
+
+    Args:
+        data: bytes o mmap con el contenido completo del archivo
+        key: Identificador del dataset (nombre de archivo o ruta)
+        full_parse: Función que parsea el archivo completo y devuelve
+            (DataFrame, encoding, separador)
+
+    Returns:
+        Tuple[pd.DataFrame, dict, Optional[ProfileState]]: DataFrame
+            completo, info de la carga (mode: 'full' | 'append' |
+            'unchanged', new_rows, encoding, separator y fingerprint, ver
+            dataset_fingerprint) y estado de profiling (None si aún no
+            se calculó)
+    """
+    entry = ProfileCache.get(key)
+
+    # Un solo recorrido de hash sobre el archivo: primero el prefijo que
+    # ocupaba la versión anterior (para compararlo) y luego la cola, que
+    # completa la huella de la versión actual
+    length = entry['length'] if entry is not None and len(data) >= entry['length'] else 0
+    hasher = _hash_range(data, 0, length)
+    prefix_hash = hasher.hexdigest()
+    digest = _hash_range(data, length, len(data), hasher).hexdigest()
+
+    if entry is not None and _extends(entry, data, prefix_hash):
+        if len(data) == length:
+            info = dict(entry['info'], mode='unchanged', new_rows=0, fingerprint=digest)
+            return entry['df'], info, entry['state']
+
+        tail = _parse_tail(data[length:], entry)
+        if tail is not None:
+            state = entry['state']
+            if len(tail):
+                if state is not None:
+                    state = state.merge(ProfileState.from_dataframe(tail, first_row=state.rows))
+                df = pd.concat([entry['df'], tail], ignore_index=True)
+            else:
+                df = entry['df']
+
+            info = dict(entry['info'], mode='append', new_rows=len(tail), fingerprint=digest)
+            _store(key, data, df, state, info)
+            return df, info, state
+
+    df, encoding, separator = full_parse()
+    info = {
+        'encoding': encoding,
+        'separator': separator,
+        'mode': 'full',
+        'new_rows': len(df),
+        'fingerprint': digest
+    }
+    _store(key, data, df, None, info)
+    return df, info, None
+
+
+def _parse_tail(tail_bytes: bytes, entry: dict) -> Optional[pd.DataFrame]:
+    """
+    Parsea solo las filas nuevas con el esquema de la versión anterior
+
+    Returns:
+        Optional[pd.DataFrame]: Filas nuevas, o None si su tipo no es
+            compatible con el guardado (se requiere parseo completo)
+    """
+    info = entry['info']
+    # Esquema de la versión anterior (no hace falta su profiling)
+    columns = entry['df'].columns.tolist()
+    previous = entry['df'].dtypes
+
+    if not tail_bytes.strip():
+        return pd.DataFrame(columns=columns)
+
+    # Forzar el dtype de columnas no numéricas para no mezclar '1' y 1
+    kinds = {col: _column_kind(str(dtype)) for col, dtype in previous.items()}
+    dtypes = {col: previous[col] for col in columns if kinds[col] == 'string'}
+
+    try:
+        tail = pd.read_csv(
+            BytesIO(tail_bytes),
+            sep=info['separator'],
+            encoding=info['encoding'],
+            header=None,
+            names=columns,
+            dtype=dtypes or None,
+            low_memory=False
+        )
+    except Exception:
+        return None
+
+    tail_kinds = {col: _column_kind(str(dtype)) for col, dtype in tail.dtypes.items()}
+    for col in columns:
+        # Una cola sin valores se infiere como float: es compatible con todo
+        if tail_kinds[col] != kinds[col] and tail[col].notna().any():
+            return None
+        if tail_kinds[col] != kinds[col]:
+            tail[col] = tail[col].astype(object)
+
+    return tail
+
+
+def _store(key: str, data, df: pd.DataFrame, state: Optional[ProfileState], info: dict):
+    """Guarda la versión actual del dataset en la caché"""
+    ProfileCache.put(key, {
+        'bytes': _entry_bytes(data, df),
+        'length': len(data),
+        'hash': info['fingerprint'],
+        'ends_with_newline': data[-1:] in (b'\n', b'\r'),
+        'df': df,
+        'state': state,
+        'info': {'encoding': info['encoding'], 'separator': info['separator']}
+    })
@@ -0,0 +1,237 @@
+"""
+Análisis de valores faltantes con una matriz de nulidad empaquetada
+
+La máscara de nulos se guarda con 1 bit por celda (np.packbits, por
+columna) y se calcula una sola vez por dataset: 10M filas x 200 columnas
+ocupan ~250MB en lugar de ~2GB como bool. De ella se derivan:
+
+- Conteo de nulos por columna (popcount)
+- Matriz de co-ocurrencia de nulos entre columnas
+- Patrones de faltantes más frecuentes
+- Completitud por fila
+
+Las derivaciones recorren la máscara en bloques de filas, así que nunca
+se materializa una matriz booleana del tamaño del dataset, y se calculan
+una sola vez por máscara (la app vuelve a dibujarlas en cada interacción).
+"""
+
+import numpy as np
+import pandas as pd
+from collections import Counter
+from typing import Iterator, List, Optional
+from .backends import get_backend
+from .config import NULLITY_BLOCK_ROWS, MISSING_TOP_PATTERNS
+
+# Número de bits en 1 de cada byte
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class NullityMask:
+    """Máscara de nulos de un dataset con 1 bit por celda"""
+
+    def __init__(self, bits: np.ndarray, columns: list, rows: int):
+        """
+        Args:
+            bits: Matriz uint8 (columnas x ceil(filas / 8)) de np.packbits
+            columns: Nombres de columnas
+            rows: Número de filas
+        """
+        self.bits = bits
+        self.columns = list(columns)
+        self.rows = rows
+        self._index = {col: i for i, col in enumerate(self.columns)}
+        self._derived = {}
+
+    def _memo(self, key, compute):
+        """Resultado derivado calculado una sola vez por máscara"""
+        if key not in self._derived:
+            self._derived[key] = compute()
+        return self._derived[key]
+
+    @staticmethod
+    def from_frame(frame, backend: Optional[str] = None) -> 'NullityMask':
+        """
+        Construye la máscara en una sola pasada por bloques de filas
+
+        Cada bloque booleano (NULLITY_BLOCK_ROWS x columnas) se empaqueta
+        apenas llega; con polars y duckdb el IS NULL se evalúa en el motor
+        y el archivo se escanea una vez, no una por columna.
+
+        Args:
+            frame: DataFrame de pandas o frame nativo del backend
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+
+        Returns:
+            NullityMask: Máscara empaquetada
+        """
+        backend = get_backend(backend)
+        columns = backend.column_names(frame)
+
+        packed = []
+        rows = 0
+        # Filas sobrantes (< 8) de un bloque: se empaquetan con el siguiente
+        carry = np.zeros((0, len(columns)), dtype=bool)
+        if columns:
+            for block in backend.null_batches(frame, columns, NULLITY_BLOCK_ROWS):
+                rows += len(block)
+                if len(carry):
+                    block = np.concatenate([carry, block])
+                whole = len(block) - len(block) % 8
+                packed.append(np.packbits(block[:whole].T, axis=1))
+                carry = block[whole:]
+        else:
+            rows = backend.count_rows(frame)
+
+        if len(carry):
+            packed.append(np.packbits(carry.T, axis=1))
+
+        if packed:
+            bits = np.concatenate(packed, axis=1)
+        else:
+            bits = np.zeros((len(columns), (rows + 7) // 8), dtype=np.uint8)
+        return NullityMask(bits, columns, rows)
+
+    @property
+    def memory_mb(self) -> float:
+        """Memoria ocupada por la máscara"""
+        return round(self.bits.nbytes / (1024 * 1024), 2)
+
+    def null_counts(self) -> dict:
+        """Nulos por columna (popcount de cada fila de bits)"""
+        counts = self._memo('null_counts', lambda: {
+            col: int(_POPCOUNT[self.bits[i]].sum(dtype=np.int64))
+            for i, col in enumerate(self.columns)
+        })
+        return dict(counts)
+
+    def column_mask(self, column: str) -> np.ndarray:
+        """Máscara booleana de una columna (n bytes, solo bajo demanda)"""
+        bits = self.bits[self._index[column]]
+        return np.unpackbits(bits, count=self.rows).astype(bool)
+
+    def columns_with_nulls(self) -> List[str]:
+        """Columnas con al menos un nulo"""
+        return [col for col, count in self.null_counts().items() if count]
+
+    def _blocks(self, columns: List[str]) -> Iterator[np.ndarray]:
+        """
+        Recorre la máscara por bloques de filas
+
+        Args:
+            columns: Columnas a incluir
+
+        Yields:
+            np.ndarray: Bits desempaquetados uint8 (columnas x filas del bloque)
+        """
+        rows_idx = [self._index[col] for col in columns]
+        block_bytes = max(NULLITY_BLOCK_ROWS // 8, 1)
+
+        for start in range(0, self.bits.shape[1], block_bytes):
+            packed = self.bits[rows_idx, start:start + block_bytes]
+            count = min(self.rows - start * 8, packed.shape[1] * 8)
+            yield np.unpackbits(packed, axis=1, count=count)
+
+    def co_occurrence(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Filas en que cada par de columnas es nulo a la vez
+
+        La diagonal es el conteo de nulos de cada columna. Se calcula como
+        B @ B.T por bloques (BLAS) en lugar de comparar pares de columnas.
+
+        Args:
+            columns: Columnas a incluir (por defecto, las que tienen nulos)
+
+        Returns:
+            pd.DataFrame: Matriz simétrica de conteos
+        """
+        if columns is None:
+            columns = self.columns_with_nulls()
+        columns = list(columns)
+
+        def compute() -> pd.DataFrame:
+            counts = np.zeros((len(columns), len(columns)), dtype=np.int64)
+            if columns:
+                for block in self._blocks(columns):
+                    # float32 es exacto hasta 2^24 filas por bloque
+                    block = block.astype(np.float32)
+                    counts += np.rint(block @ block.T).astype(np.int64)
+            return pd.DataFrame(counts, index=columns, columns=columns)
+
+        return self._memo(('co_occurrence', tuple(columns)), compute).copy()
+
+    def patterns(self, top: int = MISSING_TOP_PATTERNS) -> pd.DataFrame:
+        """
+        Patrones de faltantes más frecuentes (qué columnas faltan juntas)
+
+        Args:
+            top: Número de patrones a devolver
+
+        Returns:
+            pd.DataFrame: columns (lista de columnas nulas del patrón),
+                rows y percent, ordenado por frecuencia
+        """
+        return self._memo(('patterns', top), lambda: self._patterns(top)).copy()
+
+    def _patterns(self, top: int) -> pd.DataFrame:
+        """Cálculo de patterns (sin memo)"""
+        columns = self.columns_with_nulls()
+        counter = Counter()
+
+        if columns:
+            for block in self._blocks(columns):
+                # Cada fila se reduce a ceil(k / 8) bytes con su patrón
+                keys = np.ascontiguousarray(np.packbits(block, axis=0).T)
+                keys = keys.view(np.dtype((np.void, keys.shape[1]))).ravel()
+                unique, counts = np.unique(keys, return_counts=True)
+                counter.update(dict(zip((key.tobytes() for key in unique), counts.tolist())))
+        elif self.rows:
+            counter[b''] = self.rows
+
+        records = []
+        for key, count in counter.most_common(top):
+            flags = np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=len(columns)).astype(bool)
+            records.append({
+                'columns': [col for col, flag in zip(columns, flags) if flag],
+                'rows': count,
+                'percent': round(count / self.rows * 100, 2)
+            })
+
+        return pd.DataFrame(records, columns=['columns', 'rows', 'percent'])
+
+    def row_null_counts(self) -> np.ndarray:
+        """Número de nulos en cada fila (uint16/uint32 según columnas)"""
+        dtype = np.uint16 if len(self.columns) < 2 ** 16 else np.uint32
+        result = np.zeros(self.rows, dtype=dtype)
+        columns = self.columns_with_nulls()
+
+        if columns:
+            offset = 0
+            for block in self._blocks(columns):
+                result[offset:offset + block.shape[1]] = block.sum(axis=0, dtype=dtype)
+                offset += block.shape[1]
+
+        return result
+
+    def row_completeness(self) -> dict:
+        """
+        Completitud por fila (fracción de celdas no nulas)
+
+        Returns:
+            dict: complete_rows, complete_percent, mean_completeness y
+                histogram (filas por número de nulos)
+        """
+        return dict(self._memo('row_completeness', self._row_completeness))
+
+    def _row_completeness(self) -> dict:
+        """Cálculo de row_completeness (sin memo)"""
+        per_row = self.row_null_counts()
+        complete = int(np.count_nonzero(per_row == 0))
+        rows = max(self.rows, 1)
+        cells = rows * max(len(self.columns), 1)
+
+        return {
+            'complete_rows': complete,
+            'complete_percent': round(complete / rows * 100, 2),
+            'mean_completeness': round(float(1 - per_row.sum(dtype=np.int64) / cells) * 100, 2),
+            'histogram': pd.Series(np.bincount(per_row), name='rows').rename_axis('nulls')
+        }
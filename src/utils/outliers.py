@@ -0,0 +1,296 @@
+"""
+Detección de outliers vectorizada y por bloques
+
+Tres reglas sobre todas las columnas numéricas a la vez (operaciones NumPy
+sobre la matriz del bloque, sin apply por columna):
+
+- iqr: fuera de [Q1 - 1.5·IQR, Q3 + 1.5·IQR]
+- zscore: |x - media| / std > 3
+- mad: z modificado 0.6745·|x - mediana| / MAD > 3.5
+
+Funciona en dos pasadas en streaming:
+
+1. Estadísticas (OutlierStats): momentos mergeables por bloque y cuantiles
+   de una muestra uniforme acotada (exactos si el dataset cabe en ella).
+   Si la carga ya calculó un ProfileState y su muestra alcanza, esta
+   pasada se omite.
+2. Marcado (detect_outliers): compara cada bloque con los límites y solo
+   conserva conteos y una muestra acotada de índices de filas marcadas,
+   nunca una máscara del tamaño de los datos.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Iterable, List, Optional, Tuple
+from .backends import get_backend
+from .config import (
+    OUTLIER_CHUNK_ROWS,
+    OUTLIER_IQR_FACTOR,
+    OUTLIER_MAD_THRESHOLD,
+    OUTLIER_QUANTILE_SAMPLE,
+    OUTLIER_SAMPLE_ROWS,
+    OUTLIER_ZSCORE_THRESHOLD
+)
+from .incremental import MOMENTS, ProfileState, _chunk_moments, _merge_moments
+from .sketches import RowSample, splitmix64
+
+METHODS = ('iqr', 'zscore', 'mad')
+
+# Constante que hace al MAD comparable con la desviación estándar (normal)
+_MAD_SCALE = 0.6745
+
+
+class OutlierStats:
+    """Estadísticas por columna necesarias para los límites (pasada 1)"""
+
+    def __init__(self, columns: List[str], rows: int, moments: dict, sample: np.ndarray):
+        """
+        Args:
+            columns: Columnas numéricas
+            rows: Filas del dataset
+            moments: Momentos por columna (ver incremental.MOMENTS)
+            sample: Muestra float64 (filas x columnas) para los cuantiles
+        """
+        self.columns = list(columns)
+        self.rows = rows
+        self.exact = len(sample) >= rows
+
+        n = moments['n']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.mean = np.where(n > 0, moments['mean'], np.nan)
+            self.std = np.where(n > 1, np.sqrt(moments['m2'] / (n - 1)), np.nan)
+
+        if len(sample) and len(self.columns):
+            with np.errstate(invalid='ignore'):
+                self.q1, self.median, self.q3 = np.nanquantile(sample, [0.25, 0.5, 0.75], axis=0)
+                self.mad = np.nanmedian(np.abs(sample - self.median), axis=0)
+        else:
+            self.q1 = self.median = self.q3 = self.mad = np.full(len(self.columns), np.nan)
+
+    @staticmethod
+    def from_frame(frame, backend: Optional[str] = None,
+                   columns: Optional[List[str]] = None) -> 'OutlierStats':
+        """
+        Pasada 1: recorre el dataset por bloques acumulando estadísticas
+
+        Args:
+            frame: DataFrame de pandas o frame nativo del backend
+            backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+            columns: Columnas a analizar (por defecto, todas las numéricas)
+
+        Returns:
+            OutlierStats: Estadísticas para calcular límites
+        """
+        backend = get_backend(backend)
+        if columns is None:
+            columns = numeric_columns(frame, backend.name)
+
+        moments = _empty_moments(len(columns))
+        sample = RowSample(OUTLIER_QUANTILE_SAMPLE)
+        rows = 0
+
+        if columns:
+            for chunk in backend.iter_batches(frame, columns, OUTLIER_CHUNK_ROWS):
+                values = chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+                moments = _merge_moments(moments, _chunk_moments(values))
+                sample.update(pd.DataFrame(values, columns=columns), rows)
+                rows += len(values)
+        else:
+            rows = backend.count_rows(frame)
+
+        return OutlierStats(columns, rows, moments, _sample_matrix(sample, columns))
+
+    @staticmethod
+    def profile_covers(state: ProfileState) -> bool:
+        """
+        Indica si la muestra del ProfileState basta para los cuantiles
+
+        La muestra del profiling (PROFILE_SAMPLE_ROWS) es más chica que la
+        de la pasada 1 (OUTLIER_QUANTILE_SAMPLE); solo alcanza si contiene
+        tantas filas como las que tomaría esa pasada.
+
+        Args:
+            state: Estado de profiling del dataset
+
+        Returns:
+            bool: True si from_profile no necesita leer los datos
+        """
+        return len(state.sample.priorities) >= min(state.rows, OUTLIER_QUANTILE_SAMPLE)
+
+    @staticmethod
+    def from_profile(state: ProfileState, frame=None,
+                     backend: Optional[str] = None) -> 'OutlierStats':
+        """
+        Reutiliza el profiling de la carga (sin pasada 1)
+
+        Media y std salen de los momentos exactos; los cuantiles, de la
+        muestra de filas del ProfileState. Si esa muestra es más chica que
+        OUTLIER_QUANTILE_SAMPLE y se pasa el frame, se hace la pasada 1
+        completa para no perder precisión en los cuantiles.
+
+        Args:
+            state: Estado de profiling del dataset
+            frame: Datos del dataset (para la pasada 1 si hace falta)
+            backend: Nombre del backend (None = detectar)
+
+        Returns:
+            OutlierStats: Estadísticas para calcular límites
+        """
+        if frame is not None and not OutlierStats.profile_covers(state):
+            return OutlierStats.from_frame(frame, backend=backend)
+
+        columns = state.numeric_columns
+        return OutlierStats(columns, state.rows, state.moments, _sample_matrix(state.sample, columns))
+
+    def bounds(self, method: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Límites inferior y superior por columna
+
+        Con dispersión cero (std o MAD) no hay z definido: los límites son
+        NaN y la columna no marca outliers con ese método.
+
+        Args:
+            method: 'iqr', 'zscore' o 'mad'
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (inferior, superior)
+        """
+        if method == 'iqr':
+            iqr = self.q3 - self.q1
+            return self.q1 - OUTLIER_IQR_FACTOR * iqr, self.q3 + OUTLIER_IQR_FACTOR * iqr
+
+        if method == 'zscore':
+            spread = np.where(self.std > 0, self.std, np.nan) * OUTLIER_ZSCORE_THRESHOLD
+            return self.mean - spread, self.mean + spread
+
+        if method == 'mad':
+            spread = np.where(self.mad > 0, self.mad, np.nan) * OUTLIER_MAD_THRESHOLD / _MAD_SCALE
+            return self.median - spread, self.median + spread
+
+        raise ValueError(f"Método no soportado: {method}. Use: {', '.join(METHODS)}")
+
+
+def numeric_columns(frame, backend: Optional[str] = None) -> List[str]:
+    """Columnas numéricas del frame (sin booleanos), según su esquema"""
+    kinds = get_backend(backend).column_kinds(frame)
+    return [col for col, kind in kinds.items() if kind == 'numeric']
+
+
+def _empty_moments(k: int) -> dict:
+    """Momentos neutros para k columnas"""
+    moments = {key: np.zeros(k) for key in MOMENTS}
+    moments['min'] = np.full(k, np.inf)
+    moments['max'] = np.full(k, -np.inf)
+    return moments
+
+
+def _sample_matrix(sample: RowSample, columns: List[str]) -> np.ndarray:
+    """Muestra de filas como matriz float64"""
+    if not len(sample.priorities):
+        return np.empty((0, len(columns)))
+    return np.column_stack([sample.values[col].astype(np.float64) for col in columns])
+
+
+def detect_outliers(frame, stats: OutlierStats, backend: Optional[str] = None,
+                    methods: Iterable[str] = METHODS) -> dict:
+    """
+    Pasada 2: marca outliers bloque a bloque con los límites de stats
+
+    Por columna y método solo se guardan el conteo y hasta
+    OUTLIER_SAMPLE_ROWS posiciones de filas marcadas (muestra uniforme por
+    hash de la posición, independiente del tamaño de bloque).
+
+    Args:
+        frame: DataFrame de pandas o frame nativo del backend
+        stats: Estadísticas de la pasada 1
+        backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+        methods: Métodos a aplicar
+
+    Returns:
+        dict: rows, columns y por método: lower, upper, counts,
+            rows_flagged (filas con algún outlier) y sample_rows
+            (posiciones 0-based de filas marcadas, por columna)
+    """
+    backend = get_backend(backend)
+    methods = list(methods)
+    columns = stats.columns
+    k = len(columns)
+
+    limits = {method: stats.bounds(method) for method in methods}
+    counts = {method: np.zeros(k, dtype=np.int64) for method in methods}
+    rows_flagged = {method: 0 for method in methods}
+    samples = {method: [np.empty(0, dtype=np.int64) for _ in columns] for method in methods}
+
+    offset = 0
+    if columns:
+        for chunk in backend.iter_batches(frame, columns, OUTLIER_CHUNK_ROWS):
+            values = chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+
+            for method in methods:
+                lower, upper = limits[method]
+                # NaN (valor o límite) compara False: nunca se marca
+                flags = (values < lower) | (values > upper)
+
+                counts[method] += flags.sum(axis=0)
+                rows_flagged[method] += int(flags.any(axis=1).sum())
+
+                for j in np.flatnonzero(flags.any(axis=0)):
+                    positions = np.flatnonzero(flags[:, j]) + offset
+                    samples[method][j] = _bottom_k(np.concatenate([samples[method][j], positions]))
+
+            offset += len(values)
+
+    result = {'rows': stats.rows, 'columns': columns, 'exact': stats.exact}
+    for method in methods:
+        lower, upper = limits[method]
+        result[method] = {
+            'lower': dict(zip(columns, _floats(lower))),
+            'upper': dict(zip(columns, _floats(upper))),
+            'counts': dict(zip(columns, counts[method].tolist())),
+            'rows_flagged': rows_flagged[method],
+            'sample_rows': {col: sorted(samples[method][j].tolist()) for j, col in enumerate(columns)}
+        }
+
+    return result
+
+
+def _bottom_k(positions: np.ndarray) -> np.ndarray:
+    """Conserva las OUTLIER_SAMPLE_ROWS posiciones de menor hash"""
+    if len(positions) <= OUTLIER_SAMPLE_ROWS:
+        return positions
+    priorities = splitmix64(positions.astype(np.uint64))
+    return positions[np.argpartition(priorities, OUTLIER_SAMPLE_ROWS - 1)[:OUTLIER_SAMPLE_ROWS]]
+
+
+def _floats(values: np.ndarray) -> list:
+    """Array a lista de floats nativos (NaN -> None)"""
+    return [None if np.isnan(value) else float(value) for value in values]
+
+
+def outlier_summary(result: dict) -> pd.DataFrame:
+    """
+    Tabla resumen de detect_outliers
+
+    Args:
+        result: Resultado de detect_outliers
+
+    Returns:
+        pd.DataFrame: column, method, lower, upper, count, percent
+    """
+    rows = max(result['rows'], 1)
+    records = []
+    for col in result['columns']:
+        for method in METHODS:
+            if method not in result:
+                continue
+            count = result[method]['counts'][col]
+            records.append({
+                'column': col,
+                'method': method,
+                'lower': result[method]['lower'][col],
+                'upper': result[method]['upper'][col],
+                'count': count,
+                'percent': round(count / rows * 100, 2)
+            })
+
+    return pd.DataFrame(records, columns=['column', 'method', 'lower', 'upper', 'count', 'percent'])
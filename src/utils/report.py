@@ -0,0 +1,500 @@
+"""
+Export incremental y paralelo de reportes HTML (Fase 5)
+
+El reporte se divide en secciones independientes (resumen, una página por
+columna, correlaciones, faltantes y outliers):
+
+- Las secciones se renderizan en paralelo (ThreadPoolExecutor)
+- Cada fragmento HTML se guarda en caché en disco con una clave =
+  parámetros de la sección + digest de los datos que muestra (el contenido
+  de su columna, las columnas numéricas o la máscara de nulos), así que al
+  re-exportar solo se reconstruyen las secciones cuyos datos cambiaron
+- El HTML se escribe a disco en streaming, sección por sección y en orden,
+  sin armar el documento completo en memoria
+- Al final se agrega un resumen de tiempos por sección
+"""
+
+import hashlib
+import html
+import json
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+from .backends import get_backend
+from .config import (
+    OUTPUTS_DIR,
+    REPORT_BATCH_ROWS,
+    REPORT_CACHE_DIR,
+    REPORT_CACHE_MAX_ENTRIES,
+    REPORT_HISTOGRAM_BINS,
+    REPORT_MAX_WORKERS,
+    REPORT_TOP_VALUES
+)
+from .missing import NullityMask
+from .outliers import outlier_summary
+from .sketches import FrequencySketch
+
+# Cambiar al modificar el HTML de cualquier sección (invalida la caché)
+REPORT_VERSION = 1
+
+_STYLE = """
+body { background: #0E1117; color: #FAFAFA; font-family: sans-serif; margin: 2rem; }
+h1, h2, h3 { color: #FF4B4B; }
+section { background: #262730; border-radius: 8px; padding: 1rem 1.5rem; margin-bottom: 1.5rem; }
+table { border-collapse: collapse; font-size: 0.85rem; }
+th, td { border: 1px solid #444; padding: 4px 8px; text-align: right; }
+th { background: #1a1c24; }
+.muted { color: #999; font-size: 0.8rem; }
+"""
+
+
+class ReportSection:
+    """Sección del reporte: título, parámetros de caché y función de renderizado"""
+
+    def __init__(self, name: str, title: str, params: dict, render: Callable[[], str]):
+        """
+        Args:
+            name: Identificador único de la sección
+            title: Título visible
+            params: Todo lo que determina el HTML, incluido el digest de sus datos
+            render: Función sin argumentos que devuelve el fragmento HTML
+        """
+        self.name = name
+        self.title = title
+        self.params = params
+        self.render = render
+
+    def cache_key(self) -> str:
+        """Clave de caché del fragmento"""
+        payload = json.dumps([REPORT_VERSION, self.name, self.params], default=str, sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class FragmentCache:
+    """
+    Fragmentos HTML renderizados, guardados en disco por clave de sección
+
+    Retención: tras cada export se borran los fragmentos usados hace más
+    tiempo por encima de REPORT_CACHE_MAX_ENTRIES (leer uno cuenta como uso).
+    Los fragmentos de columnas de texto guardan sus valores más frecuentes
+    tal cual; clear() los elimina todos.
+    """
+
+    @staticmethod
+    def get(key: str) -> Optional[str]:
+        """Fragmento guardado, o None"""
+        path = REPORT_CACHE_DIR / f'{key}.html'
+        try:
+            fragment = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        # Marcar como usado: la retención borra primero los más viejos
+        path.touch()
+        return fragment
+
+    @staticmethod
+    def put(key: str, fragment: str):
+        """Guarda un fragmento (escritura atómica)"""
+        REPORT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = REPORT_CACHE_DIR / f'{key}.html'
+        # Otro export concurrente nunca lee un fragmento a medias
+        tmp = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp.write_text(fragment, encoding='utf-8')
+        tmp.replace(path)
+
+    @staticmethod
+    def entries() -> List[Path]:
+        """Fragmentos guardados, del usado más recientemente al más antiguo"""
+        if not REPORT_CACHE_DIR.exists():
+            return []
+
+        stamped = []
+        for path in REPORT_CACHE_DIR.glob('*.html'):
+            try:
+                stamped.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        return [path for _, path in sorted(stamped, reverse=True)]
+
+    @staticmethod
+    def clear() -> int:
+        """
+        Borra todos los fragmentos guardados
+
+        Returns:
+            int: Cantidad de fragmentos borrados
+        """
+        entries = FragmentCache.entries()
+        for path in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+    @staticmethod
+    def _prune():
+        """Borra los fragmentos menos usados por encima del límite"""
+        for path in FragmentCache.entries()[REPORT_CACHE_MAX_ENTRIES:]:
+            path.unlink(missing_ok=True)
+
+
+def column_digests(frame, backend, columns: List[str]) -> dict:
+    """
+    Digest del contenido de cada columna, en una pasada por bloques
+
+    Args:
+        frame: Frame nativo del backend
+        backend: Instancia de DataFrameBackend
+        columns: Columnas a resumir
+
+    Returns:
+        dict: {columna: digest hex}
+    """
+    if not columns:
+        return {}
+
+    hashers = {col: hashlib.blake2b(digest_size=16) for col in columns}
+    for chunk in backend.iter_batches(frame, columns, REPORT_BATCH_ROWS):
+        for col in columns:
+            hashers[col].update(pd.util.hash_pandas_object(chunk[col], index=False).to_numpy().tobytes())
+
+    return {col: hasher.hexdigest() for col, hasher in hashers.items()}
+
+
+def _table(df: pd.DataFrame, index: bool = False) -> str:
+    """DataFrame a tabla HTML (escapada)"""
+    return df.to_html(index=index, escape=True, border=0, na_rep='—', float_format=lambda x: f'{x:,.4g}')
+
+
+def _svg_bars(counts: List[int], labels: List[str], width: int = 480, height: int = 140) -> str:
+    """Gráfico de barras SVG mínimo (sin dependencias de plotting)"""
+    if not counts or max(counts) == 0:
+        return '<p class="muted">Sin datos para graficar</p>'
+
+    bar = width / len(counts)
+    top = max(counts)
+    rects = []
+    for i, (count, label) in enumerate(zip(counts, labels)):
+        h = count / top * (height - 10)
+        rects.append(
+            f'<rect x="{i * bar:.1f}" y="{height - h:.1f}" width="{max(bar - 1, 1):.1f}" '
+            f'height="{h:.1f}" fill="#FF4B4B"><title>{html.escape(label)}: {count:,}</title></rect>'
+        )
+
+    return f'<svg width="{width}" height="{height}" role="img">{"".join(rects)}</svg>'
+
+
+def _render_overview(metadata: dict, profile: dict) -> str:
+    rows, columns = profile['shape']
+    missing = sum(profile['missing_values'].values())
+    cells = max(rows * columns, 1)
+
+    info = pd.DataFrame([
+        ('Archivo', metadata.get('filename', '—')),
+        ('Filas', f'{rows:,}'),
+        ('Columnas', columns),
+        ('Tamaño (MB)', metadata.get('file_size_mb', '—')),
+        ('Memoria (MB)', profile['memory_usage_mb'] if profile['memory_usage_mb'] is not None else '—'),
+        ('Celdas nulas', f'{missing:,} ({missing / cells * 100:.2f}%)'),
+        ('Filas duplicadas', f"{profile['duplicates']:,}"),
+        ('Backend', metadata.get('backend', 'pandas')),
+    ], columns=['Métrica', 'Valor'])
+
+    dtypes = pd.DataFrame({
+        'Columna': profile['columns'],
+        'Tipo': [str(profile['dtypes'][col]) for col in profile['columns']],
+        'No Nulos': [profile['non_null'][col] for col in profile['columns']],
+        '% Nulos': [round(profile['missing_values'][col] / max(rows, 1) * 100, 2) for col in profile['columns']]
+    })
+
+    return _table(info) + '<h3>Columnas</h3>' + _table(dtypes)
+
+
+def _numeric_histogram(frame, backend, column: str, stats: dict) -> str:
+    """Histograma de una columna numérica calculado por bloques"""
+    if stats['min'] is None or stats['min'] == stats['max']:
+        return '<p class="muted">Columna constante o vacía</p>'
+
+    edges = np.linspace(stats['min'], stats['max'], REPORT_HISTOGRAM_BINS + 1)
+    counts = np.zeros(REPORT_HISTOGRAM_BINS, dtype=np.int64)
+    for chunk in backend.iter_batches(frame, [column], REPORT_BATCH_ROWS):
+        values = chunk[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        counts += np.histogram(values[~np.isnan(values)], bins=edges)[0]
+
+    labels = [f'{edges[i]:,.4g} – {edges[i + 1]:,.4g}' for i in range(len(counts))]
+    return _svg_bars(counts.tolist(), labels)
+
+
+def _top_values(frame, backend, column: str, sketch: Optional[FrequencySketch]) -> dict:
+    """Valores más frecuentes (del sketch del profiling o por bloques)"""
+    if sketch is None:
+        sketch = FrequencySketch()
+        for chunk in backend.iter_batches(frame, [column], REPORT_BATCH_ROWS):
+            sketch.update(chunk[column])
+    return sketch.top(REPORT_TOP_VALUES)
+
+
+def _render_column(frame, backend, column: str, profile: dict,
+                   sketch: Optional[FrequencySketch]) -> str:
+    rows = max(profile['shape'][0], 1)
+    kind = profile['kinds'][column]
+
+    stats = {
+        'Tipo': str(profile['dtypes'][column]),
+        'No Nulos': f"{profile['non_null'][column]:,}",
+        '% Nulos': f"{profile['missing_values'][column] / rows * 100:.2f}%",
+    }
+    if 'distinct' in profile:
+        stats['Distintos (aprox.)'] = f"{profile['distinct'][column]:,}"
+
+    numeric = profile['numeric'].get(column)
+    if numeric is not None:
+        for stat in ['mean', 'std', 'min', 'max']:
+            stats[stat] = '—' if numeric[stat] is None else f'{numeric[stat]:,.4g}'
+
+    parts = [_table(pd.DataFrame([stats]))]
+
+    if numeric is not None:
+        parts.append('<h4>Distribución</h4>' + _numeric_histogram(frame, backend, column, numeric))
+    elif kind in ('string', 'bool', 'other'):
+        top = _top_values(frame, backend, column, sketch)
+        labels = [str(value) for value in top]
+        parts.append('<h4>Valores más frecuentes</h4>' + _svg_bars(list(top.values()), labels))
+        parts.append(_table(pd.DataFrame({'Valor': labels, 'Conteo': list(top.values())})))
+
+    return ''.join(parts)
+
+
+def streaming_correlation(frame, backend, columns: List[str], means: dict) -> pd.DataFrame:
+    """
+    Correlación de Pearson por pares completos, acumulada por bloques
+
+    Equivale a DataFrame.corr() pero sin materializar los datos: por bloque
+    se acumulan (con matmuls) conteos, sumas, sumas de cuadrados y
+    productos cruzados de cada par sobre las filas donde ambos son válidos.
+    Los valores se centran con la media global para estabilidad numérica.
+
+    Args:
+        frame: Frame nativo del backend
+        backend: Instancia de DataFrameBackend
+        columns: Columnas numéricas
+        means: Media de cada columna
+
+    Returns:
+        pd.DataFrame: Matriz de correlación
+    """
+    k = len(columns)
+    n = np.zeros((k, k))
+    sx = np.zeros((k, k))
+    sxx = np.zeros((k, k))
+    sxy = np.zeros((k, k))
+    center = np.array([means.get(col) or 0.0 for col in columns])
+
+    for chunk in backend.iter_batches(frame, columns, REPORT_BATCH_ROWS):
+        values = chunk.to_numpy(dtype=np.float64, na_value=np.nan) - center
+        valid = (~np.isnan(values)).astype(np.float64)
+        filled = np.where(valid > 0, values, 0.0)
+
+        n += valid.T @ valid
+        sx += filled.T @ valid
+        sxx += (filled * filled).T @ valid
+        sxy += filled.T @ filled
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = n * sxy - sx * sx.T
+        var_x = n * sxx - sx * sx
+        corr = cov / np.sqrt(var_x * var_x.T)
+
+    return pd.DataFrame(np.clip(corr, -1, 1), index=columns, columns=columns)
+
+
+def _render_correlations(frame, backend, profile: dict) -> str:
+    columns = list(profile['numeric'])
+    if len(columns) < 2:
+        return '<p class="muted">Se necesitan al menos 2 columnas numéricas</p>'
+
+    means = {col: stats['mean'] for col, stats in profile['numeric'].items()}
+    corr = streaming_correlation(frame, backend, columns, means)
+    return _table(corr.round(3), index=True)
+
+
+def _render_missing(nullity: NullityMask) -> str:
+    columns = nullity.columns_with_nulls()
+    if not columns:
+        return '<p>✅ El dataset no tiene valores faltantes</p>'
+
+    completeness = nullity.row_completeness()
+    patterns = nullity.patterns()
+    patterns['columns'] = patterns['columns'].apply(
+        lambda cols: ', '.join(map(str, cols)) if cols else '(fila completa)'
+    )
+
+    return (
+        f"<p>Filas completas: {completeness['complete_rows']:,} "
+        f"({completeness['complete_percent']}%) · Completitud media: "
+        f"{completeness['mean_completeness']}%</p>"
+        '<h3>Patrones más frecuentes</h3>'
+        + _table(patterns.rename(columns={'columns': 'Columnas nulas', 'rows': 'Filas', 'percent': '% Filas'}))
+        + '<h3>Co-ocurrencia de nulos</h3>'
+        + _table(nullity.co_occurrence(columns), index=True)
+    )
+
+
+def _render_outliers(outliers: dict) -> str:
+    if not outliers['columns']:
+        return '<p class="muted">El dataset no tiene columnas numéricas</p>'
+    return _table(outlier_summary(outliers))
+
+
+def build_sections(frame, metadata: dict, profile: dict,
+                   nullity: Optional[NullityMask] = None,
+                   outliers: Optional[dict] = None,
+                   profile_state=None) -> List[ReportSection]:
+    """
+    Define las secciones del reporte
+
+    Los parámetros de cada sección incluyen el profiling de lo que muestra
+    y el digest de sus datos (column_digests, bits de la máscara de nulos),
+    así que si cambian los datos de una columna solo se invalidan su página
+    y las secciones que la usan.
+
+    Args:
+        frame: DataFrame de pandas o frame nativo del backend
+        metadata: Metadata de la carga
+        profile: Profiling (ver DataFrameBackend.profile)
+        nullity: Máscara de nulos (opcional, omite la sección si falta)
+        outliers: Resultado de detect_outliers (opcional)
+        profile_state: ProfileState de la carga (opcional, reutiliza sus sketches)
+
+    Returns:
+        List[ReportSection]: Secciones en orden de aparición
+    """
+    backend = get_backend(metadata.get('backend'))
+    overview_meta = {key: metadata.get(key) for key in ('filename', 'file_size_mb', 'backend')}
+    digests = column_digests(frame, backend, profile['columns'])
+
+    sections = [ReportSection(
+        'overview', '📋 Resumen', {'metadata': overview_meta, 'profile': profile},
+        lambda: _render_overview(metadata, profile)
+    )]
+
+    for column in profile['columns']:
+        column_params = {
+            'column': column,
+            'data': digests[column],
+            'dtype': profile['dtypes'][column],
+            'non_null': profile['non_null'][column],
+            'numeric': profile['numeric'].get(column),
+            'distinct': profile.get('distinct', {}).get(column),
+            'bins': REPORT_HISTOGRAM_BINS,
+            'top': REPORT_TOP_VALUES
+        }
+        sketch = profile_state.frequencies.get(column) if profile_state is not None else None
+        sections.append(ReportSection(
+            f'column:{column}', f'🔹 {column}', column_params,
+            lambda column=column, sketch=sketch: _render_column(frame, backend, column, profile, sketch)
+        ))
+
+    sections.append(ReportSection(
+        'correlations', '🔗 Correlaciones',
+        {'numeric': profile['numeric'], 'data': [digests[col] for col in profile['numeric']]},
+        lambda: _render_correlations(frame, backend, profile)
+    ))
+
+    if nullity is not None:
+        sections.append(ReportSection(
+            'missing', '🕳️ Valores faltantes', {
+                'columns': nullity.columns,
+                'bits': hashlib.blake2b(nullity.bits.tobytes(), digest_size=16).hexdigest()
+            },
+            lambda: _render_missing(nullity)
+        ))
+
+    if outliers is not None:
+        sections.append(ReportSection(
+            'outliers', '🎯 Outliers', {'summary': outlier_summary(outliers).to_dict('records')},
+            lambda: _render_outliers(outliers)
+        ))
+
+    return sections
+
+
+def _render_cached(section: ReportSection) -> dict:
+    """Renderiza una sección (o la lee de la caché) midiendo el tiempo"""
+    start = time.perf_counter()
+    key = section.cache_key()
+
+    fragment = FragmentCache.get(key)
+    cached = fragment is not None
+    if not cached:
+        fragment = section.render()
+        FragmentCache.put(key, fragment)
+
+    return {'fragment': fragment, 'cached': cached, 'seconds': time.perf_counter() - start}
+
+
+def export_html(sections: List[ReportSection], title: str,
+                output_path: Optional[Path] = None,
+                max_workers: int = REPORT_MAX_WORKERS) -> dict:
+    """
+    Renderiza las secciones en paralelo y escribe el HTML en streaming
+
+    Args:
+        sections: Secciones de build_sections
+        title: Título del reporte
+        output_path: Archivo de salida (por defecto outputs/reporte_<fecha>.html)
+        max_workers: Hilos de renderizado (1 = secuencial)
+
+    Returns:
+        dict: path, timings (section, seconds, cached) y total_seconds
+    """
+    start = time.perf_counter()
+
+    if output_path is None:
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_path = OUTPUTS_DIR / f'reporte_{stamp}.html'
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix('.html.part')
+
+    timings = []
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool, \
+            open(tmp_path, 'w', encoding='utf-8') as out:
+        futures = [pool.submit(_render_cached, section) for section in sections]
+
+        out.write(
+            f'<!DOCTYPE html><html lang="es"><head><meta charset="utf-8">'
+            f'<title>{html.escape(title)}</title><style>{_STYLE}</style></head><body>'
+            f'<h1>📊 {html.escape(title)}</h1>'
+            f'<p class="muted">Generado el {datetime.now():%Y-%m-%d %H:%M}</p>'
+        )
+
+        # Se escribe en orden: cada sección sale a disco apenas está lista
+        for section, future in zip(sections, futures):
+            result = future.result()
+            out.write(f'<section><h2>{html.escape(section.title)}</h2>{result["fragment"]}</section>')
+            timings.append({
+                'section': section.name,
+                'seconds': round(result['seconds'], 4),
+                'cached': result['cached']
+            })
+
+        total = time.perf_counter() - start
+        timing_df = pd.DataFrame(timings).rename(columns={
+            'section': 'Sección', 'seconds': 'Segundos', 'cached': 'Desde caché'
+        })
+        out.write(
+            '<section><h2>⏱️ Tiempos de generación</h2>'
+            f'<p>Total: {total:.2f} s · Secciones reutilizadas: '
+            f'{sum(t["cached"] for t in timings)}/{len(timings)}</p>'
+            f'{_table(timing_df)}</section></body></html>'
+        )
+
+    tmp_path.replace(output_path)
+    FragmentCache._prune()
+
+    return {'path': output_path, 'timings': timings, 'total_seconds': round(total, 4)}
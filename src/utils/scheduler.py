@@ -0,0 +1,135 @@
+"""
+Planificador de análisis con prioridades y presupuesto de tiempo
+
+Cada análisis del EDA (metadata, tipos, nulos, duplicados, estadísticas,
+gráficos) es una tarea con prioridad y costo estimado. Las tareas se
+ejecutan de menor a mayor prioridad para que lo barato se muestre primero
+y lo caro se complete después.
+
+Cada dataset tiene un presupuesto de tiempo: si el costo estimado de la
+variante completa de una tarea no cabe en lo que queda, se ejecuta su
+variante aproximada (sobre una muestra), si la tiene. Las estimaciones
+se recalibran con los tiempos medidos de las tareas completas.
+
+El orden lo da solo la prioridad, no el costo estimado: quien arma las
+tareas decide qué se muestra primero.
+"""
+
+import math
+import time
+from typing import Callable, Iterable, Iterator, Optional
+from .config import ANALYSIS_COST_NS_PER_CELL, ANALYSIS_TIME_BUDGET_S, DATAFRAME_BACKEND
+
+# Tareas completas más cortas que esto no se usan para recalibrar
+_MIN_CALIBRATION_S = 0.05
+
+
+def estimate_cost(task: str, rows: int, columns: int, backend: Optional[str] = None) -> float:
+    """
+    Segundos estimados de la variante completa de una tarea
+
+    Args:
+        task: Nombre de la tarea (clave de ANALYSIS_COST_NS_PER_CELL[backend])
+        rows: Filas a procesar
+        columns: Columnas a procesar
+        backend: Backend de DataFrame (opcional, por defecto DATAFRAME_BACKEND)
+
+    Returns:
+        float: Segundos estimados (0 si la tarea no depende del tamaño)
+
+    Raises:
+        ValueError: Si el backend no tiene tabla de costos
+    """
+    name = (backend or DATAFRAME_BACKEND).lower()
+    if name not in ANALYSIS_COST_NS_PER_CELL:
+        raise ValueError(f"Backend sin costos estimados: {name}. Use: {', '.join(ANALYSIS_COST_NS_PER_CELL)}")
+    return ANALYSIS_COST_NS_PER_CELL[name].get(task, 0) * rows * columns * 1e-9
+
+
+class AnalysisTask:
+    """Análisis con prioridad, costo estimado y variante aproximada opcional"""
+
+    def __init__(self, name: str, priority: int, cost: float, run: Callable,
+                 approximate: Optional[Callable] = None):
+        """
+        Args:
+            name: Identificador de la tarea
+            priority: Orden de ejecución (menor = antes)
+            cost: Segundos estimados de la variante completa
+            run: Variante completa (sin argumentos, devuelve el resultado)
+            approximate: Variante sobre muestra (opcional)
+        """
+        self.name = name
+        self.priority = priority
+        self.cost = cost
+        self.run = run
+        self.approximate = approximate
+
+
+class AnalysisScheduler:
+    """Ejecuta tareas por prioridad dentro de un presupuesto de tiempo"""
+
+    def __init__(self, budget_s: float = ANALYSIS_TIME_BUDGET_S, spent: float = 0.0):
+        """
+        Args:
+            budget_s: Presupuesto total del dataset en segundos
+            spent: Tiempo ya consumido por el dataset (ejecuciones anteriores)
+        """
+        self.budget = budget_s
+        self.spent = spent
+        self.tasks = []
+        # Factor real / estimado de las tareas completas ya ejecutadas
+        self.scale = 1.0
+
+    def add(self, task: AnalysisTask):
+        """Agrega una tarea a la cola"""
+        self.tasks.append(task)
+
+    @property
+    def remaining(self) -> float:
+        """Segundos que quedan del presupuesto"""
+        return max(self.budget - self.spent, 0.0)
+
+    def estimate(self, task: AnalysisTask) -> float:
+        """Costo estimado de la variante completa, recalibrado"""
+        return task.cost * self.scale
+
+    def run(self, force_full: Iterable[str] = ()) -> Iterator[dict]:
+        """
+        Ejecuta las tareas de menor a mayor prioridad
+
+        Args:
+            force_full: Tareas que usan la variante completa aunque no
+                quepan en el presupuesto (p.ej. pedidas por el usuario)
+
+        Yields:
+            dict: name, result, mode ('full' o 'sampled'), seconds y
+                estimate, apenas termina cada tarea
+        """
+        force_full = set(force_full)
+
+        for task in sorted(self.tasks, key=lambda t: t.priority):
+            estimate = self.estimate(task)
+            sampled = (
+                task.approximate is not None
+                and task.name not in force_full
+                and estimate > self.remaining
+            )
+
+            start = time.perf_counter()
+            result = task.approximate() if sampled else task.run()
+            seconds = time.perf_counter() - start
+            self.spent += seconds
+
+            # Costo infinito = variante completa forzada, sin estimación útil
+            calibrate = 0 < task.cost < math.inf
+            if not sampled and calibrate and seconds >= _MIN_CALIBRATION_S:
+                self.scale = (self.scale + seconds / task.cost) / 2
+
+            yield {
+                'name': task.name,
+                'result': result,
+                'mode': 'sampled' if sampled else 'full',
+                'seconds': round(seconds, 3),
+                'estimate': round(estimate, 3)
+            }
@@ -0,0 +1,199 @@
+"""
+Sketches mergeables para profiling incremental
+
+Todas las estructuras tienen tamaño acotado y se combinan con merge(),
+de modo que el profiling de un dataset = merge de los profilings de sus
+fragmentos (chunks, días nuevos de un log, etc.).
+
+- HyperLogLog: conteo aproximado de valores distintos
+- FrequencySketch: valores más frecuentes (Misra-Gries)
+- RowSample: muestra uniforme de filas (bottom-k por hash del id de fila)
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional
+
+
+def hash_values(values: pd.Series) -> np.ndarray:
+    """
+    Hash uint64 estable de los valores de una columna
+
+    Los numéricos se normalizan a float64 para que 1 y 1.0 (int en un chunk,
+    float en otro) produzcan el mismo hash.
+
+    Args:
+        values: Serie de pandas
+
+    Returns:
+        np.ndarray: Hashes uint64
+    """
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return pd.util.hash_array(values.to_numpy(dtype='float64', na_value=np.nan))
+    return pd.util.hash_array(values.astype(object).to_numpy())
+
+
+def splitmix64(values: np.ndarray) -> np.ndarray:
+    """Mezcla de bits splitmix64 (vectorizada) sobre enteros uint64"""
+    with np.errstate(over='ignore'):
+        z = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+class HyperLogLog:
+    """Conteo aproximado de distintos (error típico ~1.04/sqrt(2^p))"""
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def update(self, hashes: np.ndarray):
+        """
+        Agrega hashes uint64 al sketch
+
+        Args:
+            hashes: Hashes uint64 (p.ej. de hash_values)
+        """
+        if len(hashes) == 0:
+            return
+        hashes = splitmix64(hashes)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes << np.uint64(self.p)
+        # Posición del primer bit 1 en los 64 - p bits restantes; frexp da el
+        # exponente exacto porque rest >> 11 cabe en la mantisa de un float64
+        _, exponent = np.frexp((rest >> np.uint64(11)).astype(np.float64))
+        rank = np.minimum(54 - exponent, 64 - self.p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Combina dos sketches (máximo por registro)"""
+        merged = HyperLogLog(self.p)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def count(self) -> int:
+        """Estimación del número de valores distintos"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+
+        # Corrección para cardinalidades pequeñas (linear counting)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+
+        return int(round(estimate))
+
+
+class FrequencySketch:
+    """Valores más frecuentes con Misra-Gries (conteos exactos si hay <= k distintos)"""
+
+    def __init__(self, k: int = 64):
+        self.k = k
+        self.counts = {}
+        self.total = 0
+
+    def update(self, values: pd.Series):
+        """
+        Agrega los valores no nulos de una columna
+
+        Args:
+            values: Serie de pandas
+        """
+        chunk = FrequencySketch(self.k)
+        chunk.counts = values.value_counts(dropna=True).to_dict()
+        chunk.total = int(values.count())
+        chunk._compact()
+
+        merged = self.merge(chunk)
+        self.counts, self.total = merged.counts, merged.total
+
+    def merge(self, other: 'FrequencySketch') -> 'FrequencySketch':
+        """Combina dos sketches sumando conteos y compactando a k entradas"""
+        merged = FrequencySketch(self.k)
+        merged.counts = dict(self.counts)
+        for value, count in other.counts.items():
+            merged.counts[value] = merged.counts.get(value, 0) + count
+        merged.total = self.total + other.total
+        merged._compact()
+        return merged
+
+    def _compact(self):
+        """Reduce a k entradas restando el (k+1)-ésimo conteo (Misra-Gries)"""
+        if len(self.counts) <= self.k:
+            return
+        threshold = sorted(self.counts.values(), reverse=True)[self.k]
+        self.counts = {
+            value: count - threshold
+            for value, count in self.counts.items()
+            if count > threshold
+        }
+
+    def top(self, n: Optional[int] = None) -> dict:
+        """Valores más frecuentes con sus conteos (cotas inferiores)"""
+        ordered = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return dict(ordered[:n])
+
+
+class RowSample:
+    """
+    Muestra uniforme de hasta k filas, mergeable
+
+    Cada fila recibe una prioridad = hash(id global de fila); la muestra
+    conserva las k prioridades más bajas. Como la prioridad no depende del
+    chunk, merge(muestra(A), muestra(B)) == muestra(A + B).
+    """
+
+    def __init__(self, k: int = 10000):
+        self.k = k
+        self.priorities = np.empty(0, dtype=np.uint64)
+        self.values = {}
+
+    def update(self, df: pd.DataFrame, first_row: int):
+        """
+        Agrega un chunk de filas
+
+        Args:
+            df: Chunk de pandas
+            first_row: Id global de la primera fila del chunk
+        """
+        chunk = RowSample(self.k)
+        chunk.priorities = splitmix64(np.arange(first_row, first_row + len(df), dtype=np.uint64))
+        chunk.values = {col: df[col].to_numpy() for col in df.columns}
+        chunk._truncate()
+
+        merged = self.merge(chunk)
+        self.priorities, self.values = merged.priorities, merged.values
+
+    def merge(self, other: 'RowSample') -> 'RowSample':
+        """Combina dos muestras conservando las k prioridades más bajas"""
+        merged = RowSample(self.k)
+        if not len(self.priorities):
+            merged.priorities, merged.values = other.priorities, other.values
+            return merged
+        if not len(other.priorities):
+            merged.priorities, merged.values = self.priorities, self.values
+            return merged
+
+        merged.priorities = np.concatenate([self.priorities, other.priorities])
+        merged.values = {
+            col: np.concatenate([self.values[col], other.values[col]])
+            for col in self.values
+            if col in other.values
+        }
+        merged._truncate()
+        return merged
+
+    def _truncate(self):
+        """Conserva las k prioridades más bajas"""
+        if len(self.priorities) <= self.k:
+            return
+        keep = np.argpartition(self.priorities, self.k - 1)[:self.k]
+        self.priorities = self.priorities[keep]
+        self.values = {col: values[keep] for col, values in self.values.items()}
+
+    def to_frame(self) -> pd.DataFrame:
+        """Muestra como DataFrame de pandas"""
+        return pd.DataFrame(self.values)
@@ -0,0 +1,152 @@
+"""
+Test de conformidad de backends de DataFrame
+Verifica que todos los backends disponibles devuelven la misma metadata
+y estadísticas que el backend pandas de referencia.
+Ejecutar desde la raíz del proyecto: python test_backends.py
+"""
+
+import sys
+import math
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pandas as pd
+from utils import FileHandler, get_dataframe_info
+from utils.backends import BACKENDS, PandasBackend, get_backend
+
+print("=" * 70)
+print("🧪 TESTING BACKENDS - EDA Automated")
+print("=" * 70)
+
+
+def build_dataset() -> pd.DataFrame:
+    """Dataset con nulos, duplicados y tipos mixtos"""
+    rng = np.random.default_rng(7)
+    n = 500
+    df = pd.DataFrame({
+        'id': np.arange(n) % 450,
+        'value': rng.normal(10, 3, n).round(4),
+        'count': rng.integers(0, 100, n),
+        'category': rng.choice(['a', 'b', 'c'], n),
+        'flag': rng.choice([True, False], n)
+    })
+    df.loc[rng.choice(n, 40, replace=False), 'value'] = np.nan
+    df.loc[rng.choice(n, 25, replace=False), 'category'] = None
+    # Filas duplicadas exactas
+    return pd.concat([df, df.iloc[:30]], ignore_index=True)
+
+
+def close(a, b) -> bool:
+    if a is None or b is None:
+        return a is None and b is None
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def compare(reference: dict, other: dict, name: str):
+    """Compara los campos de profiling comunes a todos los backends"""
+    assert other['shape'] == reference['shape'], f"{name}: shape {other['shape']}"
+    assert other['columns'] == reference['columns'], f"{name}: columnas"
+    assert other['kinds'] == reference['kinds'], f"{name}: tipos {other['kinds']}"
+    assert other['missing_values'] == reference['missing_values'], f"{name}: nulos"
+    assert other['non_null'] == reference['non_null'], f"{name}: no nulos"
+    assert other['duplicates'] == reference['duplicates'], f"{name}: duplicados"
+    assert other['numeric'].keys() == reference['numeric'].keys(), f"{name}: columnas numéricas"
+    for col, stats in reference['numeric'].items():
+        for stat, value in stats.items():
+            assert close(other['numeric'][col][stat], value), \
+                f"{name}: {col}.{stat} = {other['numeric'][col][stat]} (esperado {value})"
+
+
+def build_mixed_dataset() -> bytes:
+    """Columna entera en las primeras 50k filas y texto en la última"""
+    lines = ['v,w'] + [f'{i},{i % 7}' for i in range(50000)] + ['abc,1']
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+class FailingBackend(PandasBackend):
+    """Backend que falla con un error que no es de encoding"""
+
+    calls = 0
+
+    def read_csv(self, source, separator: str, encoding: str):
+        FailingBackend.calls += 1
+        raise ValueError("columna con tipo inválido")
+
+
+csv_bytes = build_dataset().to_csv(index=False).encode('utf-8')
+mixed_bytes = build_mixed_dataset()
+latin_bytes = 'nombre,año\nPeña,2020\nMuñoz,2021\n'.encode('latin-1')
+
+with tempfile.TemporaryDirectory() as tmp:
+    csv_path = Path(tmp) / 'dataset.csv'
+    csv_path.write_bytes(csv_bytes)
+    mixed_path = Path(tmp) / 'mixed.csv'
+    mixed_path.write_bytes(mixed_bytes)
+    latin_path = Path(tmp) / 'latin.csv'
+    latin_path.write_bytes(latin_bytes)
+
+    reference = get_dataframe_info(
+        FileHandler._parse_csv(csv_path, ',', 'utf-8', get_backend('pandas'))[0],
+        backend='pandas'
+    )
+    mixed_reference = get_dataframe_info(pd.read_csv(BytesIO(mixed_bytes), low_memory=False), backend='pandas')
+    assert mixed_reference['kinds']['v'] == 'string'
+
+    failed = False
+    for i, name in enumerate(BACKENDS, start=1):
+        print(f"\n[{i}/{len(BACKENDS)}] Backend {name}...")
+        try:
+            backend = get_backend(name)
+        except ImportError as e:
+            print(f"  ⚠️  Omitido: {e}")
+            continue
+
+        try:
+            for label, source in [('archivo', csv_path), ('buffer', BytesIO(csv_bytes))]:
+                frame, _ = FileHandler._parse_csv(source, ',', 'utf-8', backend)
+                compare(reference, backend.profile(frame), f"{name}/{label}")
+                assert backend.count_rows(frame) == reference['shape'][0]
+                assert len(backend.head(frame, 5)) == 5
+                sample = backend.sample(frame, 100)
+                assert len(sample) == 100 and list(sample.columns) == reference['columns']
+                print(f"  ✅ Profiling idéntico a pandas ({label})")
+
+            # Tipos inferidos con todo el archivo, no solo con las primeras filas
+            for label, source in [('archivo', mixed_path), ('buffer', BytesIO(mixed_bytes))]:
+                frame, encoding = FileHandler._parse_csv(source, ',', 'utf-8', backend)
+                assert encoding == 'utf-8', f"{name}/{label}: reintentado como {encoding}"
+                compare(mixed_reference, backend.profile(frame), f"{name}/mixto/{label}")
+            print("  ✅ Texto tras 50k enteros: columna string, igual que pandas")
+
+            frame, encoding = FileHandler._parse_csv(latin_path, ',', 'utf-8', backend)
+            assert encoding != 'utf-8' and backend.head(frame, 2)['nombre'].tolist() == ['Peña', 'Muñoz']
+            print(f"  ✅ Archivo latin-1 reintentado como {encoding}")
+        except Exception as e:
+            print(f"  ❌ {e}")
+            failed = True
+
+print("\n[*] Errores que no son de encoding...")
+try:
+    FileHandler._parse_csv(BytesIO(csv_bytes), ',', 'utf-8', FailingBackend())
+    failed = True
+    print("  ❌ No se propagó el error")
+except ValueError as e:
+    if FailingBackend.calls == 1 and 'tipo inválido' in str(e):
+        print("  ✅ Se propagan sin reintentar con otros encodings")
+    else:
+        failed = True
+        print(f"  ❌ {FailingBackend.calls} intentos: {e}")
+
+print("\n" + "=" * 70)
+if failed:
+    print("❌ Hay backends que no cumplen la conformidad")
+    print("=" * 70)
+    sys.exit(1)
+
+print("✅ Todos los backends disponibles son conformes")
+print("=" * 70)
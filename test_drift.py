@@ -0,0 +1,147 @@
+"""
+Test de comparación de datasets (drift)
+Verifica que compare_profiles detecta un dataset desplazado y no marca
+drift entre dos muestras de la misma distribución, y que el almacén de
+profilings guarda un formato plano (sin pickle) y respeta su límite de
+retención.
+Ejecutar desde la raíz del proyecto: python test_drift.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pandas as pd
+from utils import drift
+from utils.drift import ProfileStore, compare_profiles
+from utils.incremental import ProfileState
+
+print("=" * 70)
+print("🧪 TESTING DRIFT - EDA Automated")
+print("=" * 70)
+
+
+def week(seed: int, n: int, shift: float = 0.0, errors: float = 0.1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'amount': rng.gamma(2.0, 10.0, n) + shift * 14.0,
+        'latency': rng.normal(200, 20, n),
+        'status': rng.choice(['ok', 'error', 'retry'], n, p=[0.85 - errors, errors, 0.15]),
+        'country': rng.choice(['AR', 'CL', 'UY'], n),
+        'user': rng.integers(0, 1000, n)
+    })
+    df.loc[rng.random(n) < 0.02, 'latency'] = np.nan
+    return df
+
+
+def by_column(df: pd.DataFrame) -> dict:
+    return df.set_index('column').to_dict('index')
+
+
+reference = ProfileState.from_dataframe(week(0, 60000))
+
+print("\n[1/4] Misma distribución (otra semana)...")
+same = compare_profiles(reference, ProfileState.from_dataframe(week(1, 60000)))
+assert (same['schema']['status'] == 'igual').all()
+assert set(same['numeric']['severity']) == {'estable'}, same['numeric']
+assert set(same['categorical']['severity']) == {'estable'}, same['categorical']
+assert same['nulls']['change'].abs().max() < 0.5
+print(f"  ✅ Sin drift: PSI máximo {same['numeric']['psi'].max():.4f}")
+
+print("\n[2/4] Dataset desplazado...")
+shifted = week(2, 60000, shift=1.0, errors=0.4)
+shifted.loc[shifted.index % 4 == 0, 'latency'] = np.nan
+shifted = shifted.drop(columns=['country']).assign(channel='web', user=lambda d: d['user'].astype(str))
+result = compare_profiles(reference, ProfileState.from_dataframe(shifted))
+
+schema = by_column(result['schema'])
+assert schema['country']['status'] == 'eliminada'
+assert schema['channel']['status'] == 'agregada'
+assert schema['user']['status'] == 'cambio de tipo'
+assert schema['amount']['status'] == schema['status']['status'] == 'igual'
+
+numeric = by_column(result['numeric'])
+assert numeric['amount']['severity'] == 'significativo', numeric['amount']
+assert 0.9 < numeric['amount']['mean_shift_std'] < 1.1, numeric['amount']['mean_shift_std']
+assert numeric['amount']['ks'] > 0.3
+assert numeric['latency']['severity'] == 'estable', numeric['latency']
+assert 'user' not in numeric
+
+categorical = by_column(result['categorical'])
+assert categorical['status']['severity'] == 'significativo', categorical['status']
+assert categorical['status']['top_shift_category'] in ('ok', 'error')
+assert abs(categorical['status']['top_shift']) > 0.25
+
+nulls = by_column(result['nulls'])
+assert 20 < nulls['latency']['change'] < 30, nulls['latency']
+print(f"  ✅ amount PSI {numeric['amount']['psi']:.2f}, status PSI {categorical['status']['psi']:.2f}, "
+      f"+{nulls['latency']['change']}% nulos en latency, 3 cambios de esquema")
+
+print("\n[3/4] Profiling por bloques (ProfileState.from_frame)...")
+df = week(3, 250000)
+df = pd.concat([df, df.sample(5000, random_state=0)], ignore_index=True)
+blocks = ProfileState.from_frame(df, backend='pandas', batch_rows=20000)
+whole = ProfileState.from_dataframe(df)
+assert blocks.rows == whole.rows == len(df)
+assert blocks.duplicates == whole.duplicates == int(df.duplicated().sum()), (blocks.duplicates, whole.duplicates)
+assert np.array_equal(blocks.row_hashes, whole.row_hashes)
+print(f"  ✅ {blocks.duplicates:,} duplicados, igual que en una sola pasada")
+
+print("\n[4/4] Almacén de profilings...")
+with tempfile.TemporaryDirectory() as tmp:
+    drift.PROFILE_STORE_DIR = Path(tmp)
+    drift.PROFILE_STORE_MAX_ENTRIES = 3
+    for i in range(5):
+        ProfileStore.save(f'huella{i}', f'semana{i}.csv', reference)
+        # saved_at tiene resolución de segundos: fijarlo para ordenar sin esperas
+        path = Path(tmp) / f'huella{i}.json'
+        info = json.loads(path.read_text(encoding='utf-8'))
+        path.write_text(json.dumps(dict(info, saved_at=f'2026-01-0{i + 1}T00:00:00')), encoding='utf-8')
+        ProfileStore._prune()
+
+    entries = ProfileStore.entries()
+    assert [e['fingerprint'] for e in entries] == ['huella4', 'huella3', 'huella2'], entries
+    assert len(list(Path(tmp).iterdir())) == 6
+
+    loaded = ProfileStore.load('huella4')
+    assert len(loaded.row_hashes) == 0 and loaded.rows == reference.rows
+    assert compare_profiles(reference, loaded)['numeric']['psi'].max() == 0
+    assert ProfileStore.exists('huella4') and not ProfileStore.exists('huella0')
+
+    # Un perfil del formato anterior no se lista, pero clear() también lo borra
+    (Path(tmp) / 'vieja.pkl').write_bytes(b'')
+    (Path(tmp) / 'vieja.json').write_text('{}', encoding='utf-8')
+    assert ProfileStore.clear() == 3
+    assert ProfileStore.entries() == [] and not list(Path(tmp).iterdir())
+
+    # Formato plano: se lee sin pickle y conserva tipos, sketches y muestra
+    mixed = week(4, 3000).assign(
+        day=pd.date_range('2026-01-01', periods=3000, freq='h'),
+        flag=lambda d: d['status'] == 'ok',
+        note=lambda d: d['country'].where(d['user'] % 7 > 0)
+    )
+    original = ProfileState.from_dataframe(mixed)
+    ProfileStore.save('mixta', 'mixta.csv', original)
+    with np.load(Path(tmp) / 'mixta.npz', allow_pickle=False) as arrays:
+        assert all(arrays[name].dtype != object for name in arrays.files)
+    restored = ProfileStore.load('mixta')
+    expected_summary, restored_summary = original.summary(), restored.summary()
+    expected_summary.pop('dtypes')
+    assert {col: str(t) for col, t in restored_summary.pop('dtypes').items()} == \
+        {col: str(t) for col, t in original.dtypes.items()}
+    assert restored_summary == expected_summary
+    assert {col: s.counts for col, s in restored.frequencies.items()} == \
+        {col: s.counts for col, s in original.frequencies.items()}
+    assert restored.sample.to_frame().equals(original.sample.to_frame())
+    assert (compare_profiles(original, restored)['schema']['status'] == 'igual').all()
+    assert ProfileStore.clear() == 1
+print("  ✅ Formato sin pickle, se conservan los más recientes y clear() borra todo")
+
+print("\n" + "=" * 70)
+print("✅ DRIFT FUNCIONANDO")
+print("=" * 70)
@@ -0,0 +1,141 @@
+"""
+Test de profiling incremental para datasets append-only
+Verifica que cargar un CSV que extiende a uno anterior solo parsea las filas
+nuevas y produce el mismo profiling que una carga completa.
+Ejecutar desde la raíz del proyecto: python test_incremental.py
+"""
+
+import sys
+import math
+from io import BytesIO
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pandas as pd
+from utils import FileHandler, get_dataframe_info
+from utils.incremental import ProfileCache, ProfileState
+
+print("=" * 70)
+print("🧪 TESTING PROFILING INCREMENTAL - EDA Automated")
+print("=" * 70)
+
+
+class FakeUpload(BytesIO):
+    """Imita el UploadedFile de Streamlit"""
+
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+
+
+def day(seed: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'user': rng.integers(0, 50, n),
+        'amount': rng.gamma(2.0, 10.0, n).round(2),
+        'status': rng.choice(['ok', 'error', 'retry'], n),
+        'clicks': rng.integers(0, 10, n)
+    })
+    return df
+
+
+def assert_same_profile(incremental: dict, full: dict):
+    for key in ['shape', 'columns', 'kinds', 'missing_values', 'non_null', 'duplicates']:
+        assert incremental[key] == full[key], f"{key}: {incremental[key]} != {full[key]}"
+    for col, stats in full['numeric'].items():
+        for stat, value in stats.items():
+            got = incremental['numeric'][col][stat]
+            assert math.isclose(got, value, rel_tol=1e-9, abs_tol=1e-9), f"{col}.{stat}: {got} != {value}"
+
+
+def load(data: bytes, name: str = 'log.csv'):
+    df, metadata, error = FileHandler.load_file(FakeUpload(data, name), backend='pandas')
+    assert error is None, error
+    return df, metadata
+
+
+def build_state(df: pd.DataFrame, metadata: dict) -> ProfileState:
+    """Lo que hace la tarea de profiling de la app después de la carga"""
+    state = ProfileState.from_frame(df, backend='pandas')
+    ProfileCache.attach_state(metadata['cache_key'], metadata['fingerprint'], state)
+    return state
+
+
+ProfileCache.clear()
+
+# Día 1: carga completa
+history = day(1, 2000)
+csv = history.to_csv(index=False).encode('utf-8')
+
+print("\n[1/5] Carga inicial...")
+df, metadata = load(csv)
+assert metadata['load_mode'] == 'full'
+# La carga solo parsea y calcula la huella: el profiling es posterior
+assert 'profile_state' not in metadata
+state = build_state(df, metadata)
+assert_same_profile(state.summary(), get_dataframe_info(df, 'pandas'))
+print("  ✅ Carga completa sin profiling; el estado se adjunta después")
+
+print("\n[2/5] Misma versión del archivo...")
+df, metadata = load(csv)
+assert metadata['load_mode'] == 'unchanged' and metadata['new_rows'] == 0
+assert metadata['profile_state'] is state
+# Una referencia con el mismo nombre (comparación) no toca la caché
+reference_df, reference_metadata, error = FileHandler.load_file(
+    FakeUpload(day(9, 500).to_csv(index=False).encode('utf-8'), 'log.csv'),
+    backend='pandas', incremental=False
+)
+assert error is None and 'cache_key' not in reference_metadata and len(reference_df) == 500
+assert load(csv)[1]['load_mode'] == 'unchanged'
+print("  ✅ Sin parseo ni profiling, aunque se haya cargado otra referencia con el mismo nombre")
+
+print("\n[3/5] Append con nulos (int -> float) y filas duplicadas...")
+tail = pd.concat([day(2, 300), history.iloc[:20]], ignore_index=True)
+tail.loc[5, 'clicks'] = np.nan
+csv += tail.to_csv(index=False, header=False).encode('utf-8')
+
+df, metadata = load(csv)
+assert metadata['load_mode'] == 'append' and metadata['new_rows'] == len(tail)
+full = pd.read_csv(BytesIO(csv))
+assert df.equals(full), "El DataFrame incremental difiere del completo"
+assert_same_profile(metadata['profile_state'].summary(), get_dataframe_info(full, 'pandas'))
+print(f"  ✅ Solo {metadata['new_rows']} filas nuevas parseadas, profiling idéntico")
+
+# Append sobre una versión cuyo profiling nunca se calculó
+other = day(5, 1000).to_csv(index=False).encode('utf-8')
+load(other, 'other.csv')
+other_df, other_metadata = load(other + day(6, 50).to_csv(index=False, header=False).encode('utf-8'), 'other.csv')
+assert other_metadata['load_mode'] == 'append' and 'profile_state' not in other_metadata
+assert len(other_df) == 1050
+print("  ✅ Sin profiling previo, el append solo parsea la cola")
+
+print("\n[4/5] Archivo modificado (no append)...")
+changed = day(3, 2400).to_csv(index=False).encode('utf-8')
+df, metadata = load(changed)
+assert metadata['load_mode'] == 'full'
+print("  ✅ Se detecta el cambio y se recarga completo")
+
+print("\n[5/5] Valor modificado en medio del archivo (mismo tamaño)...")
+big = day(4, 50000).to_csv(index=False).encode('utf-8')
+load(big)
+lines = big.split(b'\n')
+middle = len(lines) // 2
+# Reemplazar un dígito por otro: el archivo ocupa exactamente los mismos bytes
+digit = next(i for i, c in enumerate(lines[middle]) if chr(c).isdigit())
+edited = bytearray(lines[middle])
+edited[digit] = ord('1') if edited[digit] != ord('1') else ord('2')
+lines[middle] = bytes(edited)
+tampered = b'\n'.join(lines)
+assert len(tampered) == len(big) and tampered != big
+df, metadata = load(tampered)
+assert metadata['load_mode'] == 'full', metadata['load_mode']
+assert df.equals(pd.read_csv(BytesIO(tampered))), "Se devolvió el DataFrame anterior"
+print("  ✅ Se detecta el cambio aunque el tamaño no varíe")
+
+print("\n" + "=" * 70)
+print("✅ PROFILING INCREMENTAL FUNCIONANDO")
+print("=" * 70)
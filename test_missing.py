@@ -0,0 +1,114 @@
+"""
+Test del análisis de valores faltantes (máscara de nulidad de bits)
+Verifica que conteos, co-ocurrencia, patrones y completitud por fila
+coinciden con lo que se obtiene de df.isna() y que la máscara construida
+en una pasada por bloques es la misma en todos los backends.
+Ejecutar desde la raíz del proyecto: python test_missing.py
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pandas as pd
+from utils import missing
+from utils.backends import get_backend
+from utils.missing import NullityMask
+
+print("=" * 70)
+print("🧪 TESTING VALORES FALTANTES - EDA Automated")
+print("=" * 70)
+
+
+def dataset(seed: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'id': np.arange(n),
+        'amount': rng.gamma(2.0, 10.0, n),
+        'status': rng.choice(['ok', 'error', 'retry'], n).astype(object),
+        'score': rng.normal(0, 1, n),
+        'region': rng.choice(['norte', 'sur'], n).astype(object)
+    })
+    # Nulos correlacionados: si falta amount, suele faltar score
+    missing_amount = rng.random(n) < 0.2
+    df.loc[missing_amount, 'amount'] = np.nan
+    df.loc[missing_amount & (rng.random(n) < 0.7), 'score'] = np.nan
+    df.loc[rng.random(n) < 0.1, 'status'] = None
+    df.loc[rng.random(n) < 0.05, 'region'] = None
+    return df
+
+
+# Filas no múltiplo de 8 para cubrir el último byte empaquetado
+df = dataset(0, 100003)
+isna = df.isna()
+mask = NullityMask.from_frame(df, backend='pandas')
+
+print("\n[1/6] Nulos por columna...")
+expected = {col: int(isna[col].sum()) for col in df.columns}
+assert mask.null_counts() == expected, f"{mask.null_counts()} != {expected}"
+assert mask.columns_with_nulls() == [col for col in df.columns if expected[col]]
+for col in df.columns:
+    assert np.array_equal(mask.column_mask(col), isna[col].to_numpy()), col
+print(f"  ✅ Coinciden con df.isna().sum(): {expected}")
+
+print("\n[2/6] Co-ocurrencia de nulos...")
+columns = mask.columns_with_nulls()
+matrix = isna[columns].astype(np.int64)
+expected = matrix.T @ matrix
+got = mask.co_occurrence()
+assert got.index.tolist() == columns and got.columns.tolist() == columns
+assert np.array_equal(got.to_numpy(), expected.to_numpy()), f"\n{got}\n!=\n{expected}"
+print("  ✅ Coincide con isna().T @ isna()")
+
+print("\n[3/6] Patrones de faltantes...")
+keys = isna[columns].apply(lambda row: tuple(col for col in columns if row[col]), axis=1)
+expected = keys.value_counts()
+got = mask.patterns(top=len(expected))
+assert len(got) == len(expected)
+for pattern, rows, percent in got.itertuples(index=False):
+    assert rows == expected[tuple(pattern)], f"{pattern}: {rows} != {expected[tuple(pattern)]}"
+    assert percent == round(rows / len(df) * 100, 2)
+assert got['rows'].is_monotonic_decreasing
+print(f"  ✅ {len(got)} patrones con los mismos conteos que value_counts()")
+
+print("\n[4/6] Completitud por fila...")
+per_row = isna.sum(axis=1)
+completeness = mask.row_completeness()
+assert completeness['complete_rows'] == int((per_row == 0).sum())
+assert completeness['complete_percent'] == round((per_row == 0).mean() * 100, 2)
+assert completeness['mean_completeness'] == round((1 - isna.to_numpy().mean()) * 100, 2)
+assert completeness['histogram'].tolist() == np.bincount(per_row).tolist()
+assert np.array_equal(mask.row_null_counts(), per_row.to_numpy())
+print(f"  ✅ {completeness['complete_rows']:,} filas completas, igual que isna().sum(axis=1)")
+
+print("\n[5/6] Resultados memoizados...")
+patterns = mask.patterns()
+patterns['columns'] = 'modificado'
+assert mask.patterns()['columns'].tolist() != ['modificado'] * len(patterns), "Se alteró el memo"
+assert mask.co_occurrence() is not mask.co_occurrence()
+empty = NullityMask.from_frame(df[['id']], backend='pandas')
+assert empty.columns_with_nulls() == []
+assert empty.patterns()['rows'].tolist() == [len(df)]
+assert empty.row_completeness()['complete_rows'] == len(df)
+print("  ✅ Se devuelven copias y el dataset sin nulos da una sola fila completa")
+
+print("\n[6/6] Una sola pasada por bloques en cada backend...")
+# Bloques que no son múltiplo de 8: las filas sobrantes pasan al siguiente
+missing.NULLITY_BLOCK_ROWS = 4099
+for name in ['pandas', 'polars', 'duckdb']:
+    try:
+        backend = get_backend(name)
+    except ImportError as e:
+        print(f"  ⚠️  {name} omitido: {e}")
+        continue
+    blocked = NullityMask.from_frame(backend.from_pandas(df), backend=name)
+    assert blocked.rows == len(df) and blocked.columns == list(df.columns), name
+    assert np.array_equal(blocked.bits, mask.bits), f"{name}: máscara distinta"
+    print(f"  ✅ {name}: misma máscara que pandas")
+
+print("\n" + "=" * 70)
+print("✅ VALORES FALTANTES FUNCIONANDO")
+print("=" * 70)
@@ -0,0 +1,115 @@
+"""
+Test de detección de outliers (IQR, z-score y MAD)
+Verifica que, con menos filas que la muestra de cuantiles, los conteos
+coinciden con los calculados directamente con pandas, tanto en la pasada
+completa como reutilizando el profiling de la carga.
+Ejecutar desde la raíz del proyecto: python test_outliers.py
+"""
+
+import sys
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pandas as pd
+from utils.config import (
+    OUTLIER_IQR_FACTOR,
+    OUTLIER_MAD_THRESHOLD,
+    OUTLIER_QUANTILE_SAMPLE,
+    OUTLIER_ZSCORE_THRESHOLD
+)
+from utils.incremental import ProfileState
+from utils.outliers import OutlierStats, detect_outliers, outlier_summary
+
+print("=" * 70)
+print("🧪 TESTING OUTLIERS - EDA Automated")
+print("=" * 70)
+
+
+def dataset(seed: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'heavy': rng.standard_t(3, n),
+        'skewed': rng.lognormal(0, 1, n),
+        'with_nulls': rng.normal(50, 5, n),
+        'constant': np.full(n, 7.0),
+        'flag': rng.random(n) < 0.5,
+        'label': rng.choice(['a', 'b'], n)
+    })
+    df.loc[rng.random(n) < 0.1, 'with_nulls'] = np.nan
+    return df
+
+
+def pandas_counts(df: pd.DataFrame) -> dict:
+    """Conteos de referencia calculados columna a columna con pandas"""
+    numeric = df[['heavy', 'skewed', 'with_nulls', 'constant']]
+
+    q1, q3 = numeric.quantile(0.25), numeric.quantile(0.75)
+    iqr = q3 - q1
+    iqr_flags = (numeric < q1 - OUTLIER_IQR_FACTOR * iqr) | (numeric > q3 + OUTLIER_IQR_FACTOR * iqr)
+
+    z = (numeric - numeric.mean()).abs() / numeric.std().replace(0, np.nan)
+    median = numeric.median()
+    mad = (numeric - median).abs().median().replace(0, np.nan)
+    modified_z = 0.6745 * (numeric - median).abs() / mad
+
+    return {
+        'iqr': iqr_flags,
+        'zscore': z > OUTLIER_ZSCORE_THRESHOLD,
+        'mad': modified_z > OUTLIER_MAD_THRESHOLD
+    }
+
+
+def assert_matches(result: dict, expected: dict, label: str):
+    assert result['columns'] == ['heavy', 'skewed', 'with_nulls', 'constant'], result['columns']
+    for method, flags in expected.items():
+        counts = {col: int(flags[col].sum()) for col in flags.columns}
+        assert result[method]['counts'] == counts, f"{label}/{method}: {result[method]['counts']} != {counts}"
+        assert result[method]['rows_flagged'] == int(flags.any(axis=1).sum()), f"{label}/{method}"
+        for col, positions in result[method]['sample_rows'].items():
+            assert all(flags[col].iloc[positions]), f"{label}/{method}/{col}: fila no marcada"
+
+
+df = dataset(0, 90000)
+assert len(df) < OUTLIER_QUANTILE_SAMPLE
+expected = pandas_counts(df)
+
+print("\n[1/4] Pasada completa (OutlierStats.from_frame)...")
+stats = OutlierStats.from_frame(df, backend='pandas')
+assert stats.exact
+result = detect_outliers(df, stats, backend='pandas')
+assert_matches(result, expected, 'from_frame')
+print(f"  ✅ Conteos iguales a pandas: IQR {result['iqr']['rows_flagged']:,}, "
+      f"z-score {result['zscore']['rows_flagged']:,}, MAD {result['mad']['rows_flagged']:,} filas")
+
+print("\n[2/4] Reutilizando el profiling de la carga...")
+state = ProfileState.from_dataframe(df)
+assert not OutlierStats.profile_covers(state), "La muestra del profiling no debería alcanzar"
+stats = OutlierStats.from_profile(state, df, backend='pandas')
+assert stats.exact
+assert_matches(detect_outliers(df, stats, backend='pandas'), expected, 'from_profile')
+small = df.head(5000)
+small_state = ProfileState.from_dataframe(small)
+assert OutlierStats.profile_covers(small_state)
+assert_matches(
+    detect_outliers(small, OutlierStats.from_profile(small_state), backend='pandas'),
+    pandas_counts(small), 'from_profile/small'
+)
+print("  ✅ Cuantiles exactos: sin la muestra del profiling si es más chica que la pasada 1")
+
+print("\n[3/4] Columna constante...")
+for method in ['iqr', 'zscore', 'mad']:
+    assert result[method]['counts']['constant'] == 0, method
+print("  ✅ Sin dispersión no se marcan outliers")
+
+print("\n[4/4] Resumen...")
+summary = outlier_summary(result)
+assert len(summary) == 3 * len(result['columns'])
+assert summary['count'].sum() == sum(sum(result[m]['counts'].values()) for m in ['iqr', 'zscore', 'mad'])
+print(f"  ✅ {len(summary)} filas (columna x método)")
+
+print("\n" + "=" * 70)
+print("✅ OUTLIERS FUNCIONANDO")
+print("=" * 70)
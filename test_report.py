@@ -0,0 +1,119 @@
+"""
+Test del export incremental de reportes
+Verifica que la correlación por bloques coincide con df.corr(), que al
+re-exportar solo se reconstruyen las secciones cuyos datos cambiaron y que
+la caché de fragmentos respeta su límite de retención.
+Ejecutar desde la raíz del proyecto: python test_report.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+import pandas as pd
+from utils import report
+from utils.backends import get_backend
+from utils.config import REPORT_BATCH_ROWS
+from utils.missing import NullityMask
+from utils.report import FragmentCache, build_sections, export_html, streaming_correlation
+
+print("=" * 70)
+print("🧪 TESTING EXPORT DE REPORTES - EDA Automated")
+print("=" * 70)
+
+
+def dataset(seed: int, n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    base = rng.normal(0, 1, n)
+    df = pd.DataFrame({
+        'x': base,
+        # Media grande y poca varianza: pone a prueba el centrado
+        'y': 1e6 + 0.5 * base + rng.normal(0, 0.1, n),
+        'z': -2 * base + rng.normal(0, 3, n),
+        'noise': rng.integers(0, 100, n).astype(np.float64),
+        'label': rng.choice(['a', 'b', 'c'], n)
+    })
+    df.loc[rng.random(n) < 0.15, 'y'] = np.nan
+    df.loc[rng.random(n) < 0.05, 'z'] = np.nan
+    return df
+
+
+backend = get_backend('pandas')
+# Más filas que un bloque para cubrir la acumulación entre bloques
+df = dataset(0, 2 * REPORT_BATCH_ROWS + 12345)
+columns = ['x', 'y', 'z', 'noise']
+
+print("\n[1/4] Correlación por bloques vs df.corr()...")
+means = df[columns].mean().to_dict()
+got = streaming_correlation(df, backend, columns, means)
+expected = df[columns].corr()
+assert got.index.tolist() == columns and got.columns.tolist() == columns
+assert np.allclose(got.to_numpy(), expected.to_numpy(), atol=1e-9), f"\n{got}\n!=\n{expected}"
+print(f"  ✅ Máxima diferencia: {np.abs(got.to_numpy() - expected.to_numpy()).max():.2e}")
+
+print("\n[2/4] Columna constante y columna sin pares completos...")
+edge = pd.DataFrame({
+    'a': np.arange(10, dtype=np.float64),
+    'constant': np.full(10, 3.0),
+    'half': [1.0, 2.0, 3.0, 4.0, 5.0] + [np.nan] * 5,
+    'other_half': [np.nan] * 5 + [1.0, 2.0, 3.0, 4.0, 5.0]
+})
+got = streaming_correlation(edge, backend, list(edge.columns), edge.mean().to_dict())
+expected = edge.corr()
+assert np.allclose(got.to_numpy(), expected.to_numpy(), equal_nan=True), f"\n{got}\n!=\n{expected}"
+print("  ✅ NaN donde pandas da NaN (varianza cero o sin filas en común)")
+
+print("\n[3/4] Re-export reutiliza las secciones sin cambios...")
+with tempfile.TemporaryDirectory() as tmp:
+    report.REPORT_CACHE_DIR = Path(tmp) / 'fragments'
+    small = dataset(1, 5000)
+    metadata = {'filename': 'datos.csv', 'file_size_mb': 0.1, 'backend': 'pandas'}
+
+    def export(frame: pd.DataFrame) -> set:
+        """Exporta y devuelve las secciones que se reconstruyeron"""
+        sections = build_sections(frame, metadata, backend.profile(frame),
+                                  nullity=NullityMask.from_frame(frame, backend='pandas'))
+        result = export_html(sections, 'Test', output_path=Path(tmp) / 'reporte.html')
+        return {t['section'] for t in result['timings'] if not t['cached']}
+
+    assert len(export(small)) == len(small.columns) + 3
+    assert export(small) == set()
+
+    # Cambia un valor numérico: su página, el resumen y las correlaciones
+    changed = small.copy()
+    changed.loc[0, 'noise'] = 1e9
+    rebuilt = export(changed)
+    assert rebuilt == {'overview', 'column:noise', 'correlations'}, rebuilt
+    assert '<h2>🔹 noise</h2>' in (Path(tmp) / 'reporte.html').read_text(encoding='utf-8')
+
+    # Mismo profiling pero otros valores de texto: solo la página de la columna
+    swapped = changed.copy()
+    swapped['label'] = swapped['label'].map({'a': 'b', 'b': 'a', 'c': 'c'})
+    assert export(swapped) == {'column:label'}
+
+    # Un nulo nuevo: la sección de faltantes y lo que toca esa columna
+    holed = swapped.copy()
+    holed.loc[1, 'x'] = np.nan
+    assert {'missing', 'column:x'} <= export(holed)
+print(f"  ✅ Solo se reconstruyó: {', '.join(sorted(rebuilt))}")
+
+print("\n[4/4] Retención y borrado de la caché de fragmentos...")
+with tempfile.TemporaryDirectory() as tmp:
+    report.REPORT_CACHE_DIR = Path(tmp) / 'fragments'
+    report.REPORT_CACHE_MAX_ENTRIES = 4
+    small = dataset(2, 2000)
+    sections = build_sections(small, {'backend': 'pandas'}, backend.profile(small))
+    export_html(sections, 'Test', output_path=Path(tmp) / 'reporte.html')
+    kept = FragmentCache.entries()
+    assert len(kept) == 4, kept
+    assert FragmentCache.clear() == 4
+    assert FragmentCache.entries() == [] and not list(report.REPORT_CACHE_DIR.iterdir())
+print("  ✅ Se conservan los fragmentos más recientes y clear() borra todo")
+
+print("\n" + "=" * 70)
+print("✅ EXPORT DE REPORTES FUNCIONANDO")
+print("=" * 70)
@@ -0,0 +1,97 @@
+"""
+Test del planificador de análisis con presupuesto de tiempo
+Verifica las estimaciones por backend, el orden por prioridad, la variante
+aproximada cuando la completa no cabe en el presupuesto, la variante
+completa forzada y la recalibración de las estimaciones.
+Ejecutar desde la raíz del proyecto: python test_scheduler.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from utils.scheduler import AnalysisScheduler, AnalysisTask, estimate_cost
+
+print("=" * 70)
+print("🧪 TESTING PLANIFICADOR - EDA Automated")
+print("=" * 70)
+
+
+def sleeper(seconds: float, result: str):
+    """Tarea que tarda lo indicado y devuelve result"""
+    def run():
+        time.sleep(seconds)
+        return result
+    return run
+
+
+print("\n[1/5] Estimación de costo...")
+assert estimate_cost('profile', 0, 10, 'pandas') == 0
+assert estimate_cost('desconocida', 10 ** 6, 10, 'pandas') == 0
+assert estimate_cost('profile', 2 * 10 ** 6, 10, 'pandas') == 2 * estimate_cost('profile', 10 ** 6, 10, 'pandas') > 0
+# Los backends lazy re-escanean el archivo en cada tarea: cuestan más por celda
+for task in ['profile', 'nullity', 'outliers']:
+    pandas_cost = estimate_cost(task, 10 ** 6, 10, 'pandas')
+    assert estimate_cost(task, 10 ** 6, 10, 'polars') > pandas_cost, task
+    assert estimate_cost(task, 10 ** 6, 10, 'duckdb') > pandas_cost, task
+try:
+    estimate_cost('profile', 10, 10, 'spark')
+    raise AssertionError("Backend desconocido sin error")
+except ValueError:
+    pass
+print("  ✅ Proporcional a filas x columnas, con tabla por backend")
+
+print("\n[2/5] Orden por prioridad y variante completa si cabe...")
+scheduler = AnalysisScheduler(budget_s=10.0)
+scheduler.add(AnalysisTask('lenta', 2, 0.01, sleeper(0.0, 'lenta'), sleeper(0.0, 'aprox')))
+scheduler.add(AnalysisTask('metadata', 0, 0.0, lambda: 'metadata'))
+scheduler.add(AnalysisTask('tipos', 1, 0.0, lambda: 'tipos'))
+done = list(scheduler.run())
+assert [d['name'] for d in done] == ['metadata', 'tipos', 'lenta']
+assert [d['mode'] for d in done] == ['full'] * 3
+assert done[-1]['result'] == 'lenta'
+print("  ✅ metadata → tipos → lenta, todas completas")
+
+print("\n[3/5] Variante aproximada si no cabe en el presupuesto...")
+scheduler = AnalysisScheduler(budget_s=1.0, spent=0.2)
+scheduler.add(AnalysisTask('barata', 0, 0.1, sleeper(0.1, 'barata'), sleeper(0.0, 'x')))
+scheduler.add(AnalysisTask('cara', 1, 5.0, sleeper(5.0, 'completa'), sleeper(0.05, 'muestra')))
+scheduler.add(AnalysisTask('sin_aprox', 2, 5.0, sleeper(0.05, 'completa')))
+done = {d['name']: d for d in scheduler.run()}
+assert done['barata']['mode'] == 'full'
+assert done['cara']['mode'] == 'sampled' and done['cara']['result'] == 'muestra'
+assert done['cara']['seconds'] < 1.0
+# Sin variante aproximada se ejecuta completa aunque no quepa
+assert done['sin_aprox']['mode'] == 'full'
+assert 0.2 + 0.2 <= scheduler.spent < 1.0, scheduler.spent
+print(f"  ✅ 'cara' estimada en {done['cara']['estimate']} s se calculó sobre la muestra")
+
+print("\n[4/5] Variante completa forzada por el usuario...")
+scheduler = AnalysisScheduler(budget_s=0.5)
+# La app marca con costo infinito lo que ya se resolvió aproximado
+scheduler.add(AnalysisTask('cara', 0, float('inf'), sleeper(0.1, 'completa'), sleeper(0.0, 'muestra')))
+done = list(scheduler.run(force_full={'cara'}))
+assert done[0]['mode'] == 'full' and done[0]['result'] == 'completa'
+assert scheduler.scale == 1.0, f"Costo infinito no debe recalibrar: {scheduler.scale}"
+scheduler = AnalysisScheduler(budget_s=0.5)
+scheduler.add(AnalysisTask('cara', 0, float('inf'), sleeper(0.1, 'completa'), sleeper(0.0, 'muestra')))
+assert next(scheduler.run())['mode'] == 'sampled'
+print("  ✅ Se ejecuta la completa solo si se pide y la escala no cambia")
+
+print("\n[5/5] Recalibración con tiempos medidos...")
+scheduler = AnalysisScheduler(budget_s=10.0)
+# Tarda 4 veces lo estimado: la escala sube y la siguiente ya no cabe
+scheduler.add(AnalysisTask('primera', 0, 0.05, sleeper(0.2, 'a')))
+scheduler.add(AnalysisTask('segunda', 1, 4.0, sleeper(0.0, 'completa'), sleeper(0.0, 'muestra')))
+done = {d['name']: d for d in scheduler.run()}
+assert scheduler.scale > 2.0, scheduler.scale
+assert done['segunda']['mode'] == 'sampled', done['segunda']
+assert done['segunda']['estimate'] > 8.0
+print(f"  ✅ Escala {scheduler.scale:.2f}: 'segunda' pasa a estimarse en {done['segunda']['estimate']} s")
+
+print("\n" + "=" * 70)
+print("✅ PLANIFICADOR FUNCIONANDO")
+print("=" * 70)
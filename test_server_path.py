@@ -0,0 +1,105 @@
+"""
+Test de carga de archivos del servidor (lista de directorios permitidos)
+Verifica que solo se listan y cargan archivos dentro de SERVER_DATA_ROOTS
+(sin escapes con '..', symlinks ni directorios hermanos con el mismo
+prefijo) y que la carga desde disco maneja archivos vacíos, encodings
+distintos de UTF-8 y Excel.
+Ejecutar desde la raíz del proyecto: python test_server_path.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Agregar src al path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import pandas as pd
+from utils import file_handler
+from utils.file_handler import FileHandler
+
+print("=" * 70)
+print("🧪 TESTING ARCHIVOS DEL SERVIDOR - EDA Automated")
+print("=" * 70)
+
+
+def load(path) -> tuple:
+    return FileHandler.load_from_path(path, backend='pandas')
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    tmp = Path(tmp).resolve()
+    root, sibling, outside = tmp / 'data', tmp / 'data2', tmp / 'outside'
+    for directory in (root / 'sub', sibling, outside):
+        directory.mkdir(parents=True)
+
+    pd.DataFrame({'id': [1, 2, 3], 'city': ['Lima', 'Quito', 'Bogotá']}).to_csv(root / 'ok.csv', index=False)
+    (root / 'latin.csv').write_bytes('nombre;año\nPeña;2020\nMuñoz;2021\n'.encode('latin-1'))
+    (root / 'empty.csv').write_bytes(b'')
+    pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}).to_excel(root / 'book.xlsx', index=False)
+    (sibling / 'x.csv').write_text('a\n1\n', encoding='utf-8')
+    (outside / 'secret.csv').write_text('token\nabc\n', encoding='utf-8')
+    os.symlink(outside / 'secret.csv', root / 'link.csv')
+    os.symlink(outside, root / 'sub' / 'escape')
+    os.symlink(root / 'ok.csv', root / 'sub' / 'alias.csv')
+
+    # La lista de permitidos se importa en file_handler al cargar el módulo
+    file_handler.SERVER_DATA_ROOTS = [root]
+
+    print("\n[1/6] Rutas fuera de la lista permitida...")
+    escapes = [
+        root / '..' / 'outside' / 'secret.csv',
+        root / 'sub' / '..' / '..' / 'data2' / 'x.csv',
+        sibling / 'x.csv',
+        root / 'link.csv',
+        root / 'sub' / 'escape' / 'secret.csv'
+    ]
+    for path in escapes:
+        assert FileHandler.resolve_server_path(path) is None, path
+        df, metadata, error = load(path)
+        assert df is None and 'permitidos' in error, (path, error)
+    assert FileHandler.resolve_server_path(str(root) + '2') is None
+    print("  ✅ '..', symlinks hacia afuera y /data2 frente a /data se rechazan")
+
+    print("\n[2/6] Rutas dentro de la lista permitida...")
+    assert FileHandler.resolve_server_path(root / 'sub' / '..' / 'ok.csv') == root / 'ok.csv'
+    assert FileHandler.resolve_server_path(root / 'sub' / 'alias.csv') == root / 'ok.csv'
+    assert FileHandler.resolve_server_path(root) == root
+    df, metadata, error = load(root / 'sub' / 'alias.csv')
+    assert error is None and metadata['path'] == str(root / 'ok.csv')
+    print("  ✅ Symlinks internos se resuelven a su destino")
+
+    print("\n[3/6] Archivos listados...")
+    listed = FileHandler.list_server_files()
+    expected = sorted([root / 'ok.csv', root / 'latin.csv', root / 'empty.csv', root / 'book.xlsx'])
+    assert listed == expected, listed
+    assert all(FileHandler.resolve_server_path(path) == path for path in listed)
+    print(f"  ✅ {len(listed)} archivos, ninguno fuera de {root.name}/")
+
+    print("\n[4/6] Archivo vacío...")
+    df, metadata, empty_error = load(root / 'empty.csv')
+    assert df is None and 'vacío' in empty_error, empty_error
+    df, metadata, error = load(root / 'missing.csv')
+    assert df is None and 'no existe' in error, error
+    print(f"  ✅ Error claro: {empty_error}")
+
+    print("\n[5/6] CSV en latin-1...")
+    df, metadata, error = load(root / 'latin.csv')
+    assert error is None, error
+    assert list(df.columns) == ['nombre', 'año'], list(df.columns)
+    assert df['nombre'].tolist() == ['Peña', 'Muñoz']
+    assert metadata['separator'] == ';'
+    print(f"  ✅ Decodificado como {metadata['encoding']} sin caracteres corruptos")
+
+    print("\n[6/6] Excel desde disco...")
+    df, metadata, error = load(root / 'book.xlsx')
+    assert error is None, error
+    assert metadata['extension'] == 'xlsx' and metadata['rows'] == 2
+    assert df['b'].tolist() == ['x', 'y']
+    assert metadata['fingerprint']
+    print("  ✅ Excel cargado con huella")
+
+print("\n" + "=" * 70)
+print("✅ ARCHIVOS DEL SERVIDOR FUNCIONANDO")
+print("=" * 70)